@@ -0,0 +1,397 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmark suite for the transliteration and translation engines
+Measures the engines, encoding detection and the end-to-end file paths on
+the bundled subtitles and on synthetic scaled-up corpora, and compares the
+results against a saved baseline to catch regressions.
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import platform
+import tempfile
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from subtitle_io import STAGES, Stats, convert_srt_text, decode_bytes, read_text
+import convert_to_cyrillic as converter
+import translate_croatian_to_serbian as translator
+
+# Bundled subtitles used by the matcher comparison (relative to 'original')
+DEFAULT_SAMPLES = ['**/*Zootopia*.srt', '**/*Stitch.Head*.srt']
+
+# Synthetic corpus sizes in MB built by the suite by default
+DEFAULT_SIZES = [1]
+
+# A stage counts as a regression when it is this much slower than the baseline
+DEFAULT_TOLERANCE = 0.10
+
+# ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+MAXRSS_UNIT = 1 if sys.platform == 'darwin' else 1024
+
+
+def peak_rss_mb(func, *args) -> float:
+    """
+    Peak resident memory in MB that func(*args) adds, measured in a forked
+    child of its own, so the timed runs are not affected and earlier stages
+    do not count. Includes memory-mapped input and C-level buffers.
+    None where fork() is not available.
+    """
+    if resource is None or not hasattr(os, 'fork'):
+        return None
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        # A forked child starts with its peak at its current size
+        status = 1
+        try:
+            os.close(read_fd)
+            start = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            func(*args)
+            peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            os.write(write_fd, str(peak - start).encode('ascii'))
+            status = 0
+        finally:
+            os._exit(status)
+    os.close(write_fd)
+    with os.fdopen(read_fd, 'rb') as f:
+        growth = f.read()
+    _, status = os.waitpid(pid, 0)
+    if status or not growth:
+        return None
+    return int(growth) * MAXRSS_UNIT / (1024 * 1024)
+
+
+def load_samples(original_dir: Path, patterns: list) -> list:
+    """Return (name, text) pairs for every file matching the glob patterns."""
+    samples = []
+    for pattern in patterns:
+        for path in sorted(original_dir.glob(pattern)):
+            text, _ = read_text(path)
+            samples.append((path.name, text))
+    return samples
+
+
+def time_call(func, text: str, repeat: int) -> float:
+    """Return the best wall time of func(text) over repeat runs."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+# =====================================================
+# MATCHER COMPARISON
+# =====================================================
+
+def bench_matchers(samples: list, matchers: list, repeat: int) -> list:
+    """
+    Time every matcher on every sample.
+
+    Returns:
+        List of dicts with name, matcher, bytes, seconds and mb_per_s
+    """
+    results = []
+    for name, text in samples:
+        size = len(text.encode('utf-8'))
+        expected = None
+        for matcher_name in matchers:
+            matcher = translator.get_matcher(matcher_name)  # build outside the timing
+            output = matcher.sub(text)
+            if expected is None:
+                expected = output
+            elif output != expected:
+                print(f"  ! {matcher_name} output differs from {matchers[0]} on {name}")
+
+            seconds = time_call(matcher.sub, text, repeat)
+            results.append({
+                'name': name,
+                'matcher': matcher_name,
+                'bytes': size,
+                'seconds': seconds,
+                'mb_per_s': size / seconds / 1e6,
+            })
+    return results
+
+
+def print_matcher_results(results: list, baseline: str):
+    """Print a throughput table with the speedup over the baseline matcher."""
+    baseline_speed = {r['name']: r['mb_per_s'] for r in results if r['matcher'] == baseline}
+    print(f"{'File':<50} {'Matcher':<14} {'MB/s':>9} {'Speedup':>8}")
+    print("-" * 84)
+    for r in results:
+        speedup = r['mb_per_s'] / baseline_speed[r['name']] if r['name'] in baseline_speed else 0
+        print(f"{r['name'][:50]:<50} {r['matcher']:<14} {r['mb_per_s']:>9.2f} {speedup:>7.1f}x")
+
+
+def run_matchers(args, original_dir: Path):
+    """The 'matchers' command: compare the dictionary matchers."""
+    samples = load_samples(original_dir, args.samples or DEFAULT_SAMPLES)
+    if not samples:
+        print(f"No subtitles matching {args.samples} found in '{original_dir}'")
+        return 1
+
+    # Regex first, it is the baseline the others are compared against
+    matchers = args.matcher or sorted(translator.MATCHERS, key=lambda n: n != translator.RegexMatcher.name)
+    baseline = translator.RegexMatcher.name if translator.RegexMatcher.name in matchers else matchers[0]
+
+    print(f"Benchmarking {len(matchers)} matcher(s) on {len(samples)} file(s), best of {args.repeat}")
+    print("=" * 84)
+    print_matcher_results(bench_matchers(samples, matchers, args.repeat), baseline)
+    return 0
+
+
+# =====================================================
+# SUITE
+# =====================================================
+
+def build_corpus(source_files: list, target_dir: Path, size_mb: int) -> list:
+    """
+    Fill target_dir with copies of the source subtitles, cycling through
+    them until the corpus holds size_mb megabytes. Returns the new files.
+    """
+    target_dir.mkdir(parents=True, exist_ok=True)
+    limit = size_mb * 1024 * 1024
+    files = []
+    total = 0
+    while total < limit:
+        for source in source_files:
+            if total >= limit:
+                break
+            target = target_dir / f"{len(files):06d}_{source.name}"
+            shutil.copyfile(source, target)
+            files.append(target)
+            total += source.stat().st_size
+    return files
+
+
+def record(results: list, corpus: str, stage: str, seconds: float, chars: int, files: int,
+           peak_rss_mb: float = None):
+    """Append one measurement and print it."""
+    result = {
+        'corpus': corpus,
+        'stage': stage,
+        'seconds': seconds,
+        'chars': chars,
+        'files': files,
+        'chars_per_s': chars / seconds if seconds else 0.0,
+        'files_per_s': files / seconds if seconds else 0.0,
+        'peak_rss_mb': peak_rss_mb,
+    }
+    results.append(result)
+    peak = f"{peak_rss_mb:>9.1f}" if peak_rss_mb is not None else f"{'-':>9}"
+    print(f"{corpus:<10} {stage:<34} {seconds:>9.3f} {result['chars_per_s'] / 1e6:>10.2f} "
+          f"{result['files_per_s']:>9.1f} {peak}")
+
+
+def bench_corpus(corpus: str, files: list, matchers: list, repeat: int, scratch: Path) -> list:
+    """Run every stage on one corpus and return the measurements."""
+    results = []
+    raw = [path.read_bytes() for path in files]
+
+    def measure(stage, func, *args):
+        # Best of repeat timed runs, then one run in a child for the memory peak
+        record(results, corpus, stage, time_call(lambda _: func(*args), None, repeat), chars, len(files),
+               peak_rss_mb(func, *args))
+
+    # Encoding detection and decoding from memory
+    def decode_all():
+        return [decode_bytes(data)[0] for data in raw]
+    texts = decode_all()
+    chars = sum(map(len, texts))
+    measure('detect_encoding', decode_all)
+
+    # Engines on the whole text and on the dialogue only
+    text = ''.join(texts)
+    del texts
+    measure('latin_to_cyrillic', converter.latin_to_cyrillic, text)
+    measure('latin_to_cyrillic[srt]', convert_srt_text, text, converter.latin_to_cyrillic)
+    for matcher_name in matchers:
+        measure(f'croatian_to_serbian[{matcher_name}]', translator.get_matcher(matcher_name).sub, text)
+    del text
+
+    # End-to-end file paths, timed once
+    out_dir = scratch / 'out'
+
+    def convert_files(stats=None):
+        for i, path in enumerate(files):
+            converter.convert_srt(path, out_dir / f"{i}.srt", stats=stats)
+
+    def translate_files():
+        for i, path in enumerate(files):
+            translator.translate_path(path, out_dir / f"{i}_sr.srt")
+
+    # Stage split of convert_srt as it runs (cp1250 files take the byte
+    # path and have no separate detect stage), from its own instrumentation
+    stats = Stats()
+    convert_files(stats)
+    for stage in sorted(stats.timings, key=lambda s: STAGES.index(s) if s in STAGES else len(STAGES)):
+        record(results, corpus, f'convert_srt_file/{stage}', stats.timings[stage], chars, len(files))
+
+    for stage, func in (('convert_srt_file', convert_files), ('translate_file', translate_files)):
+        start = time.perf_counter()
+        func()
+        record(results, corpus, stage, time.perf_counter() - start, chars, len(files), peak_rss_mb(func))
+
+    shutil.rmtree(out_dir, ignore_errors=True)
+    return results
+
+
+def compare(results: list, baseline: dict, tolerance: float) -> int:
+    """
+    Print every stage against the baseline results.
+    Returns the number of regressions.
+    """
+    previous = {(r['corpus'], r['stage']): r for r in baseline.get('results', [])}
+    regressions = 0
+    print(f"\n{'Corpus':<10} {'Stage':<34} {'Baseline':>9} {'Now':>9} {'Change':>8}")
+    print("-" * 74)
+    for r in results:
+        old = previous.get((r['corpus'], r['stage']))
+        if not old or not old['seconds']:
+            continue
+        change = r['seconds'] / old['seconds'] - 1
+        flag = ''
+        if change > tolerance:
+            regressions += 1
+            flag = '  REGRESSION'
+        print(f"{r['corpus']:<10} {r['stage']:<34} {old['seconds']:>9.3f} {r['seconds']:>9.3f} "
+              f"{change:>+7.0%}{flag}")
+    return regressions
+
+
+def run_suite(args, original_dir: Path):
+    """The 'suite' command: benchmark every stage and optionally compare."""
+    bundled = sorted(original_dir.glob('**/*.srt'))
+    if not bundled:
+        print(f"No .srt files found in '{original_dir}'")
+        return 1
+
+    matchers = args.matcher or [translator.DEFAULT_MATCHER]
+    results = []
+
+    print(f"{'Corpus':<10} {'Stage':<34} {'Seconds':>9} {'Mchar/s':>10} {'Files/s':>9} {'Peak RSS':>9}")
+    print("-" * 86)
+    with tempfile.TemporaryDirectory(prefix='cyrillio-bench-') as tmp:
+        scratch = Path(tmp)
+        results += bench_corpus('bundled', bundled, matchers, args.repeat, scratch)
+        for size in args.sizes:
+            corpus_dir = scratch / f'corpus-{size}mb'
+            files = build_corpus(bundled, corpus_dir, size)
+            # Big corpora are timed once, repeats would only cost time
+            repeat = args.repeat if size <= 10 else 1
+            results += bench_corpus(f'{size}MB', files, matchers, repeat, scratch)
+            shutil.rmtree(corpus_dir, ignore_errors=True)
+
+    report = {
+        'meta': {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpus': os.cpu_count(),
+            'repeat': args.repeat,
+            'sizes_mb': args.sizes,
+            'matchers': matchers,
+        },
+        'results': results,
+    }
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResults saved to: {args.json}")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"\n✗ {regressions} stage(s) more than {args.tolerance:.0%} slower than the baseline")
+            return 1
+        print(f"\n✓ No stage more than {args.tolerance:.0%} slower than the baseline")
+    return 0
+
+
+def main():
+    """Main function to run the benchmarks."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description='Benchmark the transliteration and translation engines'
+    )
+    subparsers = parser.add_subparsers(dest='command')
+
+    suite = subparsers.add_parser(
+        'suite',
+        help='Benchmark every stage on the bundled and synthetic corpora (default)'
+    )
+    suite.add_argument(
+        '-s', '--sizes',
+        type=int,
+        nargs='*',
+        default=DEFAULT_SIZES,
+        help='Synthetic corpus sizes in MB (default: 1, e.g. --sizes 1 100)'
+    )
+    suite.add_argument(
+        '--json',
+        help='Save the results to this JSON file'
+    )
+    suite.add_argument(
+        '--baseline',
+        help='Compare against results saved earlier with --json'
+    )
+    suite.add_argument(
+        '--tolerance',
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help=f'Allowed slowdown per stage before failing (default: {DEFAULT_TOLERANCE})'
+    )
+
+    matchers = subparsers.add_parser(
+        'matchers',
+        help='Compare the dictionary matchers on bundled subtitles'
+    )
+    matchers.add_argument(
+        'samples',
+        nargs='*',
+        help="Glob patterns of subtitles under 'original' (default: Zootopia and Stitch Head)"
+    )
+
+    for sub in (suite, matchers):
+        sub.add_argument(
+            '-m', '--matcher',
+            action='append',
+            choices=sorted(translator.MATCHERS),
+            help='Matcher to benchmark (repeatable)'
+        )
+        sub.add_argument(
+            '-n', '--repeat',
+            type=int,
+            default=3,
+            help='Runs per measurement, the best one is reported (default: 3)'
+        )
+
+    # 'suite' is the default command
+    argv = sys.argv[1:]
+    if not argv or argv[0] not in ('suite', 'matchers', '-h', '--help'):
+        argv = ['suite'] + argv
+    args = parser.parse_args(argv)
+
+    original_dir = Path(__file__).parent.resolve() / 'original'
+    if args.command == 'matchers':
+        return run_matchers(args, original_dir)
+    return run_suite(args, original_dir)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
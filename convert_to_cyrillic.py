@@ -7,10 +7,26 @@ Converts all .srt files from 'original' folder to Cyrillic in 'cyrillic' folder
 
 import os
 import re
+import json
+import codecs
 import difflib
+import hashlib
 import shutil
+from collections import Counter
+from functools import partial
 from pathlib import Path
 
+from subtitle_io import (NO_STATS, Engine, Stats, StatsReport, byte_srt_pattern, convert_srt_text,
+                         detect_encoding, is_large_file, normalize_newlines, pool_map, print_result,
+                         run_pipeline, sniff_bytes, stream_convert)
+
+# Bump when the conversion logic changes in a way that alters the output,
+# so the manifest invalidates files converted by an older version
+CONVERTER_VERSION = 2
+
+# Incremental rebuild manifest, stored next to the 'cyrillic' folder
+MANIFEST_NAME = '.cyrillic-manifest.json'
+
 # Serbian Latin to Cyrillic transliteration map
 LATIN_TO_CYRILLIC = {
     # Digraphs must come first (longer matches have priority)
@@ -47,96 +63,742 @@ LATIN_TO_CYRILLIC = {
     'Š': 'Ш', 'š': 'ш',
 }
 
-# Build regex pattern - sort by length descending to match digraphs first
-PATTERN = re.compile('|'.join(
-    re.escape(k) for k in sorted(LATIN_TO_CYRILLIC.keys(), key=len, reverse=True)
-))
+
+def build_tables(mapping: dict) -> tuple:
+    """
+    Split a transliteration map into a digraph lookahead pattern and a
+    single-letter str.translate table.
+
+    Returns:
+        Tuple of (digraph_pattern, digraphs: dict, single_table: list)
+    """
+    # Lookahead table: first letter -> letters that complete a digraph
+    lookahead = {}
+    digraphs = {}
+    singles = {}
+    for latin, cyrillic in mapping.items():
+        if len(latin) == 1:
+            singles[latin] = cyrillic
+        elif len(latin) == 2:
+            lookahead.setdefault(latin[0], []).append(latin[1])
+            digraphs[latin] = cyrillic
+        else:
+            raise ValueError(f"Unsupported transliteration key: {latin!r}")
+
+    # Only the letters that can start a digraph (l, n, d) are ever looked at
+    # by the regex engine, e.g. 'l[j]|L[jJ]|...'; without digraphs the
+    # pattern never matches
+    digraph_pattern = re.compile('|'.join(
+        re.escape(first) + '[' + ''.join(re.escape(c) for c in followers) + ']'
+        for first, followers in lookahead.items()
+    ) or '(?!)')
+
+    # str.translate is fastest with a sequence indexed by code point; code
+    # points past the end raise IndexError and are left unchanged
+    single_table = [chr(i) for i in range(max(map(ord, singles), default=-1) + 1)]
+    for latin, cyrillic in singles.items():
+        single_table[ord(latin)] = cyrillic
+
+    return digraph_pattern, digraphs, single_table
+
+
+# Precomputed transliteration tables
+DIGRAPH_PATTERN, DIGRAPHS, SINGLE_TABLE = build_tables(LATIN_TO_CYRILLIC)
+
+# Letters a streamed long line is never cut after (see subtitle_io.find_cut)
+DIGRAPH_STARTS = ''.join(sorted({latin[0] for latin in DIGRAPHS}))
+
+# Deletes every letter SINGLE_TABLE converts, to count them
+SINGLE_LETTERS = {i: None for i, ch in enumerate(SINGLE_TABLE) if ch != chr(i)}
+
+# Single-byte encodings converted straight from bytes to UTF-8
+BYTE_ENCODINGS = ['cp1250', 'iso-8859-2']
+
+# Marks unused output byte positions; never part of valid UTF-8
+FILLER = 0xFF
+
+# Joins pieces converted in one pass (see subtitle_io.SEPARATOR)
+BYTE_SEPARATOR = b'\x00'
+
+
+def build_byte_tables(mapping: dict, encoding: str) -> tuple:
+    """
+    Build the tables transliterate_bytes uses for a single-byte encoding.
+
+    Returns:
+        Tuple of (convert_tables, decode_tables, letters, fixup_pattern,
+        fixups, srt_pattern), or None if the mapping does not allow this
+    """
+    singles = {k: v for k, v in mapping.items() if len(k) == 1}
+    digraphs = {k: v for k, v in mapping.items() if len(k) == 2}
+    decoded = {}
+    for b in range(256):
+        try:
+            decoded[b] = bytes([b]).decode(encoding)
+        except UnicodeDecodeError:
+            pass
+
+    # Digraphs are fixed up in the converted output, which matches
+    # DIGRAPH_PATTERN only if single letters map one to one and to nothing
+    # the encoding already has (so the UTF-8 of 'Лј' only comes from 'Lj'),
+    # and no digraph's second letter starts another (so fixups never overlap)
+    firsts = {k[0] for k in digraphs}
+    if (len(set(singles.values())) != len(singles)
+            or set(singles.values()) & set(decoded.values())
+            or any(k[1] in firsts or k[0] not in singles or k[1] not in singles for k in digraphs)):
+        return None
+
+    # A byte becomes up to three UTF-8 bytes: one table per output position,
+    # FILLER where a byte has no byte at that position
+    def tables(convert):
+        planes = [bytearray([FILLER]) * 256 for _ in range(3)]
+        for b, ch in decoded.items():
+            for i, byte in enumerate((convert(ch)).encode('utf-8')):
+                planes[i][b] = byte
+        return [bytes(plane) for plane in planes]
+
+    fixups = {
+        (singles[k[0]] + singles[k[1]]).encode('utf-8'): v.encode('utf-8')
+        for k, v in digraphs.items()
+    }
+    fixup_pattern = re.compile(b'|'.join(map(re.escape, fixups)) or b'(?!)')
+    # The bytes of the letters that are converted, to count them
+    letters = bytes(b for b, ch in decoded.items() if ch in singles)
+    return (tables(lambda ch: singles.get(ch, ch)), tables(lambda ch: ch), letters, fixup_pattern, fixups,
+            byte_srt_pattern(encoding))
+
+
+# Byte-level tables per encoding for LATIN_TO_CYRILLIC
+BYTE_TABLES = {encoding: build_byte_tables(LATIN_TO_CYRILLIC, encoding) for encoding in BYTE_ENCODINGS}
+
+
+def translate_bytes(data: bytes, tables: list) -> bytes:
+    """Map every byte to its UTF-8 sequence through one table per output position."""
+    out = bytearray(3 * len(data))
+    for i, table in enumerate(tables):
+        out[i::3] = data.translate(table)
+    return bytes(out.translate(None, bytes([FILLER])))
+
+
+def transliterate_bytes(data: bytes, srt: bool = True, byte_tables: dict = None,
+                        stats: Stats = None, encoding: str = None) -> tuple:
+    """
+    Convert raw cp1250 or iso-8859-2 file contents straight to UTF-8,
+    without decoding them first; encoding is sniffed if not given.
+
+    Returns:
+        Tuple of (converted UTF-8 bytes, encoding), or None if the data
+        needs the regular path (another encoding, or NUL bytes)
+    """
+    encoding = encoding or sniff_bytes(data)[0]
+    tables = (BYTE_TABLES if byte_tables is None else byte_tables).get(encoding)
+    if not tables or BYTE_SEPARATOR in data:
+        return None
+    convert_tables, decode_tables, letters, fixup_pattern, fixups, srt_pattern = tables
+
+    # Line endings as text-mode reads normalize them
+    if b'\r' in data:
+        data = data.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+    # Dialogue at even indices, cue headers and markup at odd ones
+    pieces = srt_pattern.split(data) if srt else [data]
+
+    dialogue = BYTE_SEPARATOR.join(pieces[::2])
+    converted = translate_bytes(dialogue, convert_tables)
+    converted, digraphs = fixup_pattern.subn(lambda m: fixups[m.group()], converted)
+    if stats is not None and stats is not NO_STATS:
+        # A digraph is two letters but counts once
+        stats.count('replacements', len(dialogue) - len(dialogue.translate(None, letters)) - digraphs)
+    pieces[::2] = converted.split(BYTE_SEPARATOR)
+    if len(pieces) > 1:
+        pieces[1::2] = translate_bytes(BYTE_SEPARATOR.join(pieces[1::2]), decode_tables).split(BYTE_SEPARATOR)
+    return b''.join(pieces), encoding
+
+
+def convert_data(data: bytes, convert, srt: bool = True, byte_tables: dict = None,
+                 stats: Stats = None) -> tuple:
+    """
+    Convert raw file contents with convert (only the dialogue with srt=True),
+    decoding them at most once. cp1250 and iso-8859-2 input is converted
+    straight from the bytes (see transliterate_bytes) and comes back as
+    UTF-8 bytes, anything else as str; write_converted_file takes both.
+
+    Returns:
+        Tuple of (converted: bytes or str, encoding: str)
+    """
+    stats = stats or NO_STATS
+    with stats.time('detect'):
+        encoding, content = sniff_bytes(data)
+    if content is None:
+        with stats.time('convert'):
+            result = transliterate_bytes(data, srt, byte_tables, stats, encoding)
+        if result is not None:
+            return result
+        # A single-byte encoding decodes every byte it does not leave undefined
+        with stats.time('detect'):
+            content = normalize_newlines(data.decode(encoding))
+    with stats.time('convert'):
+        converted = convert_srt_text(content, convert) if srt else convert(content)
+    return converted, encoding
+
+
+def write_converted_file(output_path: Path, converted):
+    """
+    Write converted text, or UTF-8 bytes from transliterate_bytes, as
+    UTF-8 with BOM and platform line endings.
+    """
+    if isinstance(converted, str):
+        with open(output_path, 'w', encoding='utf-8-sig') as f:
+            f.write(converted)
+        return
+    if os.linesep != '\n':
+        converted = converted.replace(b'\n', os.linesep.encode('ascii'))
+    with open(output_path, 'wb') as f:
+        f.write(codecs.BOM_UTF8)
+        f.write(converted)
 
 
 def latin_to_cyrillic(text: str) -> str:
     """Convert Serbian Latin text to Cyrillic."""
-    return PATTERN.sub(lambda m: LATIN_TO_CYRILLIC[m.group()], text)
+    # Digraphs first (one callback per digraph, not per character),
+    # then every remaining letter in a single translate pass
+    text = DIGRAPH_PATTERN.sub(lambda m: DIGRAPHS[m.group()], text)
+    return text.translate(SINGLE_TABLE)
 
 
-def detect_encoding(file_path: Path) -> str:
-    """Try to detect the file encoding."""
-    encodings = ['utf-8', 'utf-8-sig', 'cp1250', 'cp1251', 'iso-8859-2', 'iso-8859-1', 'latin-1']
-    
-    for encoding in encodings:
-        try:
-            with open(file_path, 'r', encoding=encoding) as f:
-                f.read()
-            return encoding
-        except (UnicodeDecodeError, UnicodeError):
-            continue
-    
-    return 'utf-8'  # fallback
+class Transliterator(Engine):
+    """
+    Reusable Latin to Cyrillic engine.
+    The tables are built once from mapping (LATIN_TO_CYRILLIC by default);
+    see Engine for convert_bytes, convert_file and convert_many.
+    """
+
+    def __init__(self, mapping: dict = None):
+        if mapping is None:
+            self.mapping = LATIN_TO_CYRILLIC
+            self.digraph_pattern, self.digraphs, self.single_table = DIGRAPH_PATTERN, DIGRAPHS, SINGLE_TABLE
+            self.byte_tables = BYTE_TABLES
+        else:
+            self.mapping = dict(mapping)
+            self.digraph_pattern, self.digraphs, self.single_table = build_tables(self.mapping)
+            self.byte_tables = {encoding: build_byte_tables(self.mapping, encoding) for encoding in BYTE_ENCODINGS}
+        self.hold = ''.join(sorted({latin[0] for latin in self.digraphs}))
 
+    def convert(self, text: str) -> str:
+        """Convert Serbian Latin text to Cyrillic."""
+        digraphs = self.digraphs
+        text = self.digraph_pattern.sub(lambda m: digraphs[m.group()], text)
+        return text.translate(self.single_table)
 
-def convert_srt_file(input_path: Path, output_path: Path) -> bool:
+    def convert_bytes(self, data: bytes, srt: bool = False) -> str:
+        """Like Engine.convert_bytes, converting cp1250/iso-8859-2 input without decoding it first."""
+        converted, _ = convert_data(data, self.convert, srt, self.byte_tables)
+        return converted.decode('utf-8') if isinstance(converted, bytes) else converted
+
+
+def counting_converter(stats: Stats):
     """
-    Convert a single SRT file from Latin to Cyrillic.
-    Returns True if successful, False otherwise.
+    Return a latin_to_cyrillic that also counts the letters it converts
+    (a digraph counts once) as 'replacements' in stats.
     """
+    if stats is NO_STATS:
+        return latin_to_cyrillic
+
+    def convert(text):
+        text, digraphs = DIGRAPH_PATTERN.subn(lambda m: DIGRAPHS[m.group()], text)
+        stats.count('replacements', digraphs + len(text) - len(text.translate(SINGLE_LETTERS)))
+        return text.translate(SINGLE_TABLE)
+
+    return convert
+
+
+def convert_srt(input_path: Path, output_path: Path, stream: bool = False, stats: Stats = None) -> tuple:
+    """
+    Convert a single SRT file from Latin to Cyrillic without printing.
+    Safe to run in a worker process. With stream=True, and always for
+    files over LARGE_FILE_SIZE, the file is converted cue by cue instead
+    of being read into memory. Timings and counters are recorded in stats
+    if given.
+
+    Returns:
+        Tuple of (success: bool, encoding: str or None, error: str or None,
+                  sha256 of the source: str or None)
+    """
+    stats = stats or NO_STATS
+    convert = counting_converter(stats)
+    encoding = None
+    digest = None
     try:
-        # Detect and read with appropriate encoding
-        encoding = detect_encoding(input_path)
-        print(f"  Detected encoding: {encoding}")
+        if stream or is_large_file(input_path):
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            # Counted apart, since a restart with another encoding starts over
+            counted = Stats() if stats is not NO_STATS else NO_STATS
+            encoding, digest = stream_convert(input_path, output_path, counting_converter(counted),
+                                              on_restart=counted.counters.clear, stats=stats,
+                                              hold=DIGRAPH_STARTS)
+            stats.count('replacements', counted.counters.get('replacements', 0))
+            return True, encoding, None, digest
         
-        with open(input_path, 'r', encoding=encoding, errors='replace') as f:
-            content = f.read()
+        # Read once, hash for the manifest and decode with the detected encoding
+        with stats.time('read'):
+            with open(input_path, 'rb') as f:
+                data = f.read()
+            digest = hashlib.sha256(data).hexdigest()
+        stats.count('bytes_in', len(data))
         
-        # Convert to Cyrillic
-        converted_content = latin_to_cyrillic(content)
+        # Convert the dialogue to Cyrillic (cue numbers, timings and tags stay as-is);
+        # cp1250 and iso-8859-2 are converted straight from the bytes
+        converted_content, encoding = convert_data(data, convert, stats=stats)
         
         # Ensure output directory exists
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
         # Write with UTF-8 encoding (with BOM for better compatibility)
-        with open(output_path, 'w', encoding='utf-8-sig') as f:
-            f.write(converted_content)
+        with stats.time('write'):
+            write_converted_file(output_path, converted_content)
+        stats.count('bytes_out', os.path.getsize(output_path))
         
-        return True
+        return True, encoding, None, digest
     
     except Exception as e:
-        print(f"  Error: {e}")
+        return False, encoding, str(e), digest
+
+
+def convert_srt_file(input_path: Path, output_path: Path) -> bool:
+    """
+    Convert a single SRT file from Latin to Cyrillic.
+    Returns True if successful, False otherwise.
+    """
+    success, encoding, error, _ = convert_srt(input_path, output_path)
+    print_result(encoding, error)
+    return success
+
+
+def convert_task(input_path: Path, output_path: Path, stream: bool = False, instrument: bool = False) -> tuple:
+    """
+    Run convert_srt for run_conversions.
+    Returns its result plus the file's Stats (None unless instrument is set).
+    """
+    stats = Stats(input_path) if instrument else None
+    return convert_srt(input_path, output_path, stream, stats) + (stats,)
+
+
+def run_conversions(tasks: list, jobs: int = 1, stream: bool = False, instrument: bool = False):
+    """
+    Convert (input_path, output_path) pairs, in a process pool if jobs > 1.
+    Yields convert_task results in the same order as tasks.
+    """
+    return pool_map(partial(convert_task, stream=stream, instrument=instrument),
+                    [task[0] for task in tasks], [task[1] for task in tasks], jobs=jobs)
+
+
+def read_source(task: tuple, stats: Stats) -> tuple:
+    """Pipeline read stage: the source bytes and their sha256."""
+    with open(task[0], 'rb') as f:
+        data = f.read()
+    stats.count('bytes_in', len(data))
+    return data, hashlib.sha256(data).hexdigest()
+
+
+def convert_source(value: tuple, instrument: bool = False) -> tuple:
+    """
+    Pipeline convert stage (in a worker): decode and convert the dialogue.
+    Returns (converted_content, encoding, digest, stats); with instrument,
+    stats holds the worker's detect time and replacements for
+    write_converted to add to the file's Stats, else it is None.
+    """
+    data, digest = value
+    stats = Stats() if instrument else NO_STATS
+    result = convert_data(data, counting_converter(stats), stats=stats)
+    return result + (digest, stats if instrument else None)
+
+
+def write_converted(task: tuple, value: tuple, stats: Stats) -> tuple:
+    """Pipeline write stage. Returns a convert_task style result."""
+    converted_content, encoding, digest, worker_stats = value
+    if worker_stats:
+        # Detection ran inside the convert stage, which was timed as a whole
+        detect = worker_stats.timings.get('detect', 0.0)
+        if detect:
+            stats.add_time('detect', detect)
+            stats.add_time('convert', -detect)
+        for name, n in worker_stats.counters.items():
+            stats.count(name, n)
+    output_path = task[1]
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    write_converted_file(output_path, converted_content)
+    stats.count('bytes_out', os.path.getsize(output_path))
+    return True, encoding, None, digest
+
+
+def table_fingerprint() -> str:
+    """Hash of the transliteration table and converter version."""
+    payload = json.dumps([CONVERTER_VERSION, sorted(LATIN_TO_CYRILLIC.items())], ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def file_sha256(file_path: Path) -> str:
+    """Hash a file in chunks."""
+    sha = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+def load_manifest(manifest_path: Path) -> dict:
+    """
+    Load the rebuild manifest.
+    Returns an empty file table if it is missing, unreadable or was written
+    for a different transliteration table.
+    """
+    fingerprint = table_fingerprint()
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get('table') == fingerprint and isinstance(manifest.get('files'), dict):
+            return manifest
+    except (OSError, ValueError):
+        pass
+    return {'table': fingerprint, 'files': {}}
+
+
+def save_manifest(manifest_path: Path, manifest: dict):
+    """Write the manifest atomically."""
+    tmp_path = manifest_path.with_name(manifest_path.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=1, sort_keys=True)
+    os.replace(tmp_path, manifest_path)
+
+
+def manifest_entry(stat: os.stat_result, digest: str, output: str) -> dict:
+    """Build a manifest record for a converted source file."""
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha256': digest, 'output': output}
+
+
+def is_up_to_date(entry: dict, source: Path, stat: os.stat_result, output: str, output_path: Path) -> bool:
+    """
+    Check a manifest entry against the source file and its converted copy.
+    The source is only hashed when its size matches but its mtime changed.
+    """
+    if not entry or entry.get('output') != output or not output_path.exists():
+        return False
+    if entry.get('size') != stat.st_size:
         return False
+    if entry.get('mtime_ns') == stat.st_mtime_ns:
+        return True
+    if entry.get('sha256') == file_sha256(source):
+        entry['mtime_ns'] = stat.st_mtime_ns  # touched, but same content
+        return True
+    return False
+
+
+def find_srt_files(root: Path) -> list:
+    """
+    Find .srt files under root with os.scandir, in the same order and
+    with the same matches as root.glob('**/*.srt'): a directory's entries
+    in listing order, then each subdirectory depth first (symlinked
+    directories are not followed).
+    """
+    found = []
+    suffix = os.path.normcase('.srt')
+
+    def scan(directory: Path):
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except PermissionError:
+            return
+        subdirs = []
+        for entry in entries:
+            if os.path.normcase(entry.name).endswith(suffix):
+                found.append(directory / entry.name)
+            try:
+                if entry.is_dir() and not entry.is_symlink():
+                    subdirs.append(entry.name)
+            except OSError:
+                pass
+        for name in subdirs:
+            scan(directory / name)
+
+    scan(root)
+    return found
+
+
+def list_folders(root: Path) -> list:
+    """The folders directly in root, in listing order."""
+    with os.scandir(root) as it:
+        return [root / entry.name for entry in it if entry.is_dir()]
+
+
+# Separators replaced by spaces before folder names are compared
+TITLE_SEPARATORS_RE = re.compile(r'[._\[\]()-]')
+
+# Substring matches get this added to their similarity ratio
+SUBSTRING_BOOST = 0.3
+
+# A folder only matches above this ratio
+MATCH_THRESHOLD = 0.5
+
+# Folders sharing the rarest title words are scored first, up to this many
+SEED_LIMIT = 256
+
+
+def normalize_title(name: str) -> str:
+    """Lowercase name with dots, underscores, brackets and dashes as spaces."""
+    return TITLE_SEPARATORS_RE.sub(' ', name).lower().strip()
+
+
+def title_prefix(title: str) -> str:
+    """
+    The release name part of a normalized title: the words before the
+    first one with a digit (year, season, episode or resolution).
+    """
+    words = []
+    for word in title.split():
+        if any(ch.isdigit() for ch in word):
+            break
+        words.append(word)
+    return ' '.join(words)
+
+
+def character_keys(name: str) -> list:
+    """(character, n) for the n-th occurrence of each character in name."""
+    seen = {}
+    keys = []
+    for ch in name:
+        seen[ch] = seen.get(ch, 0) + 1
+        keys.append((ch, seen[ch]))
+    return keys
+
+
+class FolderIndex:
+    """
+    Index of movie folders for matching root-level subtitle files.
+    best_match() picks the same folder as scoring every folder with difflib
+    would; the folders given are only indexed on first use.
+    """
+
+    def __init__(self, folders: list = ()):
+        self.pending = list(folders)
+        # Release name prefix -> name of the folder it last matched
+        self.matches = {}
+        self.results = {}
+        self.folders = []
+        self.names = []
+        self.by_folder = {}
+        self.by_name = {}
+        self.by_length = {}
+        self.words = {}
+        self.trigrams = {}
+        # (character, n) -> folders with at least n of that character
+        self.characters = {}
+
+    def build(self):
+        """Index the folders given to the constructor, if not done yet."""
+        pending, self.pending = self.pending, []
+        for folder in pending:
+            self.index(folder)
+
+    def add(self, folder: Path):
+        """Add a folder; on equal scores earlier folders win."""
+        self.build()
+        self.index(folder)
+
+    def index(self, folder: Path):
+        """Add a folder to the name, length, word, trigram and character indexes."""
+        index = len(self.folders)
+        name = normalize_title(folder.name)
+        self.folders.append(folder)
+        self.names.append(name)
+        self.by_folder[folder.name] = index
+        self.by_name.setdefault(name, []).append(index)
+        self.by_length.setdefault(len(name), []).append(index)
+        for word in set(name.split()):
+            self.words.setdefault(word, []).append(index)
+        for trigram in {name[i:i + 3] for i in range(len(name) - 2)}:
+            self.trigrams.setdefault(trigram, []).append(index)
+        for key in character_keys(name):
+            self.characters.setdefault(key, []).append(index)
+
+    def shared_characters(self, title: str) -> Counter:
+        """
+        Number of characters each folder name has in common with title
+        (counted with multiplicity, as quick_ratio() does), by folder index.
+        """
+        shared = Counter()
+        for key in character_keys(title):
+            shared.update(self.characters.get(key, ()))
+        return shared
+
+    def substring_folders(self, title: str) -> set:
+        """Indexes of the folders whose name is in title or contains it."""
+        found = set()
+        # Folder names that are substrings of the title
+        for start in range(len(title) + 1):
+            for end in range(start, len(title) + 1):
+                found.update(self.by_name.get(title[start:end], ()))
+        # Folder names containing the title hold all of its trigrams
+        if len(title) >= 3:
+            postings = min((self.trigrams.get(title[i:i + 3], ()) for i in range(len(title) - 2)), key=len)
+        else:
+            postings = range(len(self.names))
+        found.update(i for i in postings if title in self.names[i])
+        return found
+
+    def seed_folders(self, title: str) -> list:
+        """Indexes of folders sharing the title's rarest words."""
+        seeds = []
+        for word in sorted(set(title.split()), key=lambda w: len(self.words.get(w, ()))):
+            if len(seeds) >= SEED_LIMIT:
+                break
+            seeds.extend(self.words.get(word, ()))
+        return seeds
+
+    def best_match(self, filename: str) -> Path:
+        """The best matching folder for a filename, or None."""
+        self.build()
+        title = normalize_title(filename)
+        matcher = difflib.SequenceMatcher(None, title)
+        best_ratio = 0
+        best_index = None
+        scored = set()
+        prefix = title_prefix(title)
+
+        def beats(ratio, index):
+            # Highest ratio wins, and the earliest folder on a tie
+            return ratio > MATCH_THRESHOLD and (
+                ratio > best_ratio or (ratio == best_ratio and index < best_index))
+
+        def bound(matches, length):
+            # Ratio of matches matching characters, as difflib computes it
+            total = len(title) + length
+            return 2.0 * matches / total if total else 1.0
+
+        def score(index):
+            nonlocal best_ratio, best_index
+            scored.add(index)
+            name = self.names[index]
+            boost = SUBSTRING_BOOST if (title in name or name in title) else 0
+            # Cheap upper bounds first (real_quick_ratio() is the length
+            # bound); ratio() only when the folder can still win
+            if not beats(bound(min(len(title), len(name)), len(name)) + boost, index):
+                return
+            matcher.set_seq2(name)
+            if not beats(matcher.quick_ratio() + boost, index):
+                return
+            ratio = matcher.ratio() + boost
+            if beats(ratio, index):
+                best_ratio, best_index = ratio, index
+
+        def finish():
+            self.results[title] = (len(self.folders), best_ratio, best_index)
+            if best_index is not None and prefix:
+                self.matches[prefix] = self.folders[best_index].name
+            return None if best_index is None else self.folders[best_index]
+
+        # Same title as before: only folders added since then can do better
+        if title in self.results:
+            count, best_ratio, best_index = self.results[title]
+            for index in range(count, len(self.folders)):
+                score(index)
+            return finish()
+
+        # The folder that matched the same release name is likely to again
+        seed = self.by_folder.get(self.matches.get(prefix)) if prefix else None
+        if seed is not None:
+            score(seed)
+        # Then every folder that gets the substring boost, and the folders
+        # sharing the title's rarest words, to raise the best ratio early
+        for index in self.substring_folders(title):
+            if index not in scored:
+                score(index)
+        for index in self.seed_folders(title):
+            if index not in scored:
+                score(index)
+
+        # Every boosted folder is scored by now, so each remaining folder's
+        # ratio is bounded without a boost: by real_quick_ratio(), which
+        # only needs the name length, and by quick_ratio(), which only
+        # needs the characters it shares with the title. Lengths are tried
+        # from the best length bound down, stopping once that bound cannot
+        # beat the best ratio so far; within a length, folders sharing too
+        # few characters are skipped using the character index, which
+        # counts the shared characters of all folders at once. Only the
+        # folders left are scored with difflib.
+        shared = None
+        for length in sorted(self.by_length, key=lambda n: bound(min(len(title), n), n), reverse=True):
+            most = min(len(title), length)
+            if bound(most, length) <= MATCH_THRESHOLD or bound(most, length) < best_ratio:
+                break
+            if shared is None:
+                shared = self.shared_characters(title)
+            # Fewest shared characters that can still reach the best ratio
+            fewest = most
+            while fewest > 0 and bound(fewest - 1, length) > MATCH_THRESHOLD and bound(fewest - 1, length) >= best_ratio:
+                fewest -= 1
+            for index in [i for i in self.by_length[length] if shared[i] >= fewest]:
+                if index not in scored and beats(bound(shared[index], length), index):
+                    score(index)
+
+        return finish()
 
 
 def find_best_match(filename: str, folders: list) -> Path:
     """Find the best matching folder for a filename."""
-    # Normalize filename (replace dots/underscores with spaces)
-    clean_name = re.sub(r'[._\[\]()-]', ' ', filename).lower().strip()
-    
-    best_ratio = 0
-    best_folder = None
-    
-    for folder in folders:
-        # Normalize folder name
-        clean_folder = re.sub(r'[._\[\]()-]', ' ', folder.name).lower().strip()
-        
-        # Check similarity
-        ratio = difflib.SequenceMatcher(None, clean_name, clean_folder).ratio()
-        
-        # Boost if substring (e.g. "Monster House" in "Monster House 2006")
-        if clean_name in clean_folder or clean_folder in clean_name:
-            ratio += 0.3
-            
-        if ratio > best_ratio and ratio > 0.5:  # Threshold
-            best_ratio = ratio
-            best_folder = folder
-            
-    return best_folder
+    return FolderIndex(folders).best_match(filename)
 
 
 def main():
     """Main function to process all SRT files."""
+    import argparse
+    
+    parser = argparse.ArgumentParser(
+        description="Convert Serbian Latin subtitles in 'original' to Cyrillic in 'cyrillic'"
+    )
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        default=1,
+        help='Number of worker processes for conversion (0 = one per CPU, default: 1)'
+    )
+    parser.add_argument(
+        '-f', '--force',
+        action='store_true',
+        help='Reconvert every file, even if it is unchanged since the last run'
+    )
+    parser.add_argument(
+        '--stream',
+        action='store_true',
+        help='Convert files cue by cue with bounded memory instead of reading them whole'
+    )
+    parser.add_argument(
+        '--pipeline',
+        action='store_true',
+        help='Overlap reading and writing files with conversion (asyncio pipeline, bounded memory)'
+    )
+    parser.add_argument(
+        '--stats',
+        action='store_true',
+        help='Print the time spent per stage and the counters at the end'
+    )
+    parser.add_argument(
+        '--stats-log',
+        metavar='FILE',
+        help='Write per-file timings and counters to FILE as JSON lines'
+    )
+    
+    args = parser.parse_args()
+    if args.pipeline and args.stream:
+        parser.error('--pipeline and --stream cannot be combined')
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    
     # Get the script's directory
     script_dir = Path(__file__).parent.resolve()
     
     # Define input and output directories
     original_dir = script_dir / 'original'
     cyrillic_dir = script_dir / 'cyrillic'
+    manifest_path = script_dir / MANIFEST_NAME
     
     # Validate input directory exists
     if not original_dir.exists():
@@ -144,7 +806,7 @@ def main():
         return
     
     # Find all .srt files recursively (in movie subfolders)
-    srt_files = list(original_dir.glob('**/*.srt'))
+    srt_files = find_srt_files(original_dir)
     
     if not srt_files:
         print(f"No .srt files found in '{original_dir}'")
@@ -160,60 +822,152 @@ def main():
     print(f"Output directory: {cyrillic_dir}")
     print("-" * 50)
     
-    # Get existing folders in original for matching
-    existing_folders = [f for f in original_dir.iterdir() if f.is_dir()]
+    # Index the existing folders in original for matching
+    folder_index = FolderIndex(list_folders(original_dir))
+    
+    # Manifest of previous runs; only files converted in this run or
+    # still up to date are carried over, so deleted sources drop out
+    manifest = load_manifest(manifest_path)
+    previous_files = {} if args.force else manifest['files']
+    manifest['files'] = {}
+    stats = {}
+    skipped_count = 0
+    
+    # Opt-in instrumentation: per-file timings and counters
+    instrument = args.stats or bool(args.stats_log)
+    report = StatsReport('convert_to_cyrillic', args.stats_log) if instrument else None
+    move_times = {}
 
-    # Process each file
-    success_count = 0
-    for srt_file in srt_files:
-        # Preserve folder structure: get relative path from original_dir
-        relative_path = srt_file.relative_to(original_dir)
+    # Plan files one by one. Folder matching and moving root-level files
+    # stays serial so parallel workers never race on the same folders.
+    # Each task is (input_path, output_path, log lines)
+    def plan_tasks():
+        nonlocal skipped_count
+        for srt_file in srt_files:
+            log = []
         
-        # Check if file is in root of original_dir
-        if len(relative_path.parts) == 1:
-            # It's in the root. Try to find a matching folder.
-            match = find_best_match(srt_file.stem, existing_folders)
+            # Preserve folder structure: get relative path from original_dir
+            relative_path = srt_file.relative_to(original_dir)
+        
+            # Check if file is in root of original_dir
+            if len(relative_path.parts) == 1:
+                # It's in the root. Try to find a matching folder.
+                match = folder_index.best_match(srt_file.stem)
             
-            if match:
-                folder_name = match.name
-                print(f"\n[{folder_name} (Matched existing)]")
-            else:
-                folder_name = srt_file.stem
-                print(f"\n[{folder_name} (Auto-created)]")
-                # Create the folder in original
-                target_folder = original_dir / folder_name
-                target_folder.mkdir(exist_ok=True)
-                # Add to existing folders so subsequent files can match it
-                existing_folders.append(target_folder)
+                if match:
+                    folder_name = match.name
+                    log.append(f"\n[{folder_name} (Matched existing)]")
+                else:
+                    folder_name = srt_file.stem
+                    log.append(f"\n[{folder_name} (Auto-created)]")
+                    # Create the folder in original
+                    target_folder = original_dir / folder_name
+                    target_folder.mkdir(exist_ok=True)
+                    # Add to existing folders so subsequent files can match it
+                    folder_index.add(target_folder)
             
-            # Move the original file to the folder
-            new_original_path = original_dir / folder_name / srt_file.name
-            try:
-                shutil.move(str(srt_file), str(new_original_path))
-                print(f"  -> Moved original to: {folder_name}/{srt_file.name}")
-                # Update srt_file path for conversion
-                srt_file = new_original_path
-            except Exception as e:
-                print(f"  ! Failed to move original: {e}")
+                # Move the original file to the folder
+                new_original_path = original_dir / folder_name / srt_file.name
+                move_stats = Stats() if instrument else NO_STATS
+                try:
+                    with move_stats.time('move'):
+                        shutil.move(str(srt_file), str(new_original_path))
+                    log.append(f"  -> Moved original to: {folder_name}/{srt_file.name}")
+                    # Update srt_file path for conversion
+                    srt_file = new_original_path
+                except Exception as e:
+                    log.append(f"  ! Failed to move original: {e}")
+                move_times[srt_file] = move_stats.elapsed('move')
             
-            output_file = cyrillic_dir / folder_name / srt_file.name
-        else:
-            # It's already in a subfolder, preserve structure
-            output_file = cyrillic_dir / relative_path
-            movie_folder = relative_path.parts[0]
-            print(f"\n[{movie_folder}]")
+                output_file = cyrillic_dir / folder_name / srt_file.name
+            else:
+                # It's already in a subfolder, preserve structure
+                output_file = cyrillic_dir / relative_path
+                movie_folder = relative_path.parts[0]
+                log.append(f"\n[{movie_folder}]")
 
-        print(f"  Converting: {srt_file.name}")
+            # Skip files whose source and output are unchanged since the last run
+            key = srt_file.relative_to(original_dir).as_posix()
+            output = output_file.relative_to(cyrillic_dir).as_posix()
+            check_stats = Stats(srt_file) if instrument else NO_STATS
+            with check_stats.time('check'):
+                try:
+                    stat = srt_file.stat()
+                except OSError:
+                    stat = None
+                up_to_date = stat and is_up_to_date(previous_files.get(key), srt_file, stat, output, output_file)
+            if up_to_date:
+                manifest['files'][key] = previous_files[key]
+                skipped_count += 1
+                if report:
+                    check_stats.status = 'skipped'
+                    check_stats.count('cache_hits')
+                    report.add(check_stats)
+                continue
+            stats[key] = (stat, output, check_stats)
+
+            log.append(f"  Converting: {srt_file.name}")
+            yield srt_file, output_file, log
+
+    def report_task(task: tuple, result: tuple):
+        nonlocal success_count, task_count
+        srt_file, output_file, log = task
+        success, encoding, error, digest, file_stats = result
+        task_count += 1
+        for line in log:
+            print(line)
+        print_result(encoding, error)
         
-        if convert_srt_file(srt_file, output_file):
+        if success:
             print(f"  ✓ Saved to: {output_file.relative_to(cyrillic_dir)}")
             success_count += 1
+            key = srt_file.relative_to(original_dir).as_posix()
+            stat, output, _ = stats[key]
+            if stat:
+                manifest['files'][key] = manifest_entry(stat, digest, output)
         else:
             print(f"  ✗ Failed to convert")
+        
+        if report:
+            key = srt_file.relative_to(original_dir).as_posix()
+            file_stats.status = 'converted' if success else 'failed'
+            file_stats.count('cache_misses')
+            file_stats.add_time('check', stats[key][2].elapsed('check'))
+            if srt_file in move_times:
+                file_stats.add_time('move', move_times[srt_file])
+            report.add(file_stats)
+
+    success_count = 0
+    task_count = 0
+    if args.pipeline:
+        # Discover, read, convert (in --jobs processes) and write concurrently
+        def report_pipeline(task, result, error, file_stats):
+            if error is not None:
+                result = (False, None, str(error), None)
+            report_task(task, result + (file_stats if report else None,))
+
+        run_pipeline(plan_tasks(), read_source, partial(convert_source, instrument=instrument), write_converted,
+                     report_pipeline, jobs=jobs, instrument=instrument)
+    else:
+        # Convert (in parallel with --jobs) and report in the original order
+        tasks = list(plan_tasks())
+        for task, result in zip(tasks, run_conversions(tasks, jobs, args.stream, instrument)):
+            report_task(task, result)
+    
+    try:
+        save_manifest(manifest_path, manifest)
+    except OSError as e:
+        print(f"\n  ! Failed to save manifest: {e}")
     
     # Summary
     print("\n" + "=" * 50)
-    print(f"Conversion complete: {success_count}/{len(srt_files)} files converted successfully")
+    print(f"Conversion complete: {success_count}/{task_count} files converted successfully")
+    if skipped_count:
+        print(f"Skipped {skipped_count} unchanged file(s) (use --force to reconvert)")
+    if report:
+        report.close()
+        if args.stats:
+            report.print_summary()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,998 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Shared file helpers for the subtitle tools
+Reads each subtitle file once, detects its encoding from memory and
+parses SRT cues so that only dialogue text reaches the converters.
+Large files are streamed from a memory map with bounded memory, batches can run as an
+asyncio pipeline that overlaps file I/O with conversion, and every stage
+can be timed and counted per file when instrumentation is switched on.
+"""
+
+import io
+import os
+import re
+import json
+import mmap
+import time
+import codecs
+import hashlib
+import threading
+from collections import namedtuple
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+
+# Byte order marks, checked before any decoding attempt.
+# UTF-32 LE must come before UTF-16 LE (its BOM is a prefix of it).
+BOMS = [
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+]
+
+# Encodings tried in order when the data has no BOM
+ENCODINGS = ['utf-8', 'cp1250', 'cp1251', 'iso-8859-2', 'iso-8859-1', 'latin-1']
+
+
+def detect_bom(data: bytes) -> str:
+    """Return the encoding announced by a BOM, or None."""
+    for bom, encoding in BOMS:
+        if data.startswith(bom):
+            return encoding
+    return None
+
+
+def normalize_newlines(text: str) -> str:
+    """Translate CRLF and lone CR line endings to LF, as text-mode reads do."""
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+def decode_bytes(data: bytes) -> tuple:
+    """
+    Decode raw file contents, trying the candidate encodings in order.
+    Line endings are normalized the same way text-mode reads do it.
+
+    Returns:
+        Tuple of (text: str, encoding: str)
+    """
+    encoding = detect_bom(data)
+    if encoding:
+        return normalize_newlines(data.decode(encoding, errors='replace')), encoding
+
+    for encoding in ENCODINGS:
+        try:
+            return normalize_newlines(data.decode(encoding)), encoding
+        except (UnicodeDecodeError, UnicodeError):
+            continue
+
+    return normalize_newlines(data.decode('utf-8', errors='replace')), 'utf-8'  # fallback
+
+
+def undefined_bytes(encoding: str) -> bytes:
+    """Byte values a single-byte encoding cannot decode."""
+    undefined = bytearray()
+    for b in range(256):
+        try:
+            bytes([b]).decode(encoding)
+        except UnicodeDecodeError:
+            undefined.append(b)
+    return bytes(undefined)
+
+
+# Every candidate after UTF-8 is a single-byte encoding; it decodes the
+# data exactly when none of these bytes occur in it
+UNDEFINED_BYTES = {encoding: undefined_bytes(encoding) for encoding in ENCODINGS[1:]}
+
+
+def sniff_bytes(data: bytes) -> tuple:
+    """
+    Detect the encoding decode_bytes picks for data, decoding only where
+    that is the check itself. Single-byte candidates are checked by
+    scanning for the bytes they leave undefined; text decoded on the way
+    (a BOM or UTF-8) is handed back, so it is never decoded twice.
+
+    Returns:
+        Tuple of (encoding: str, text: str or None), text as decode_bytes
+        returns it, or None for a single-byte encoding
+    """
+    encoding = detect_bom(data)
+    if encoding:
+        return encoding, normalize_newlines(data.decode(encoding, errors='replace'))
+
+    for encoding in ENCODINGS:
+        undefined = UNDEFINED_BYTES.get(encoding)
+        if undefined is not None:
+            if not any(b in data for b in undefined):
+                return encoding, None
+            continue
+        try:
+            return encoding, normalize_newlines(data.decode(encoding))
+        except (UnicodeDecodeError, UnicodeError):
+            continue
+
+    return 'utf-8', normalize_newlines(data.decode('utf-8', errors='replace'))  # fallback
+
+
+def read_text(file_path: Path) -> tuple:
+    """
+    Read a file once and decode it with the detected encoding.
+
+    Returns:
+        Tuple of (text: str, encoding: str)
+    """
+    with open(file_path, 'rb') as f:
+        data = f.read()
+    return decode_bytes(data)
+
+
+def detect_encoding(file_path: Path) -> str:
+    """Try to detect the file encoding."""
+    return read_text(file_path)[1]
+
+
+# =====================================================
+# SRT PARSING
+# =====================================================
+
+# One subtitle block. Every field keeps its raw text including line
+# endings, so index + timing + text reproduces the input exactly.
+Cue = namedtuple('Cue', ['index', 'timing', 'text'])
+
+# Cue header: an optional cue number line ('12', a stray BOM is tolerated)
+# directly followed by a timing line ('00:01:02,345 --> 00:01:04,567').
+# [^\S\n] is whitespace that does not cross a line break.
+HEADER_RE = re.compile(
+    r'^(\ufeff?[^\S\n]*\d+[^\S\n]*\n)?'
+    r'([^\S\n]*\d+:\d{1,2}:\d{1,2}[,.]\d{1,3}[^\S\n]*-->[^\S\n]*\d+:\d{1,2}:\d{1,2}[,.]\d{1,3}[^\n]*(?:\n|\Z))',
+    re.M
+)
+
+# Markup that must never be converted: <i>, </i>, <font color="...">, {\an8}
+MARKUP_RE = re.compile(r'(<[^<>\n]*>|\{[^{}\n]*\})')
+
+# Cue headers or markup in a single group, so that SRT_SPLIT_RE.split()
+# alternates dialogue and everything else in one scan (see
+# convert_srt_text). A header is HEADER_RE with the line break before it
+# instead of the one after it: a match then starts at a literal character
+# like markup does, which lets the scan skip ahead instead of trying every
+# position. Markup cannot span a line break, so the two never overlap.
+SRT_SPLIT_RE = re.compile(
+    r'(\n(?:\ufeff?[^\S\n]*\d+[^\S\n]*\n)?'
+    r'[^\S\n]*\d+:\d{1,2}:\d{1,2}[,.]\d{1,3}[^\S\n]*-->[^\S\n]*\d+:\d{1,2}:\d{1,2}[,.]\d{1,3}[^\n]*'
+    r'|<[^<>\n]*>|\{[^{}\n]*\})'
+)
+
+# Dialogue of this many cues is converted in one call
+CUE_BATCH = 512
+
+# Joins dialogue pieces of a batch (see convert_pieces)
+SEPARATOR = '\x00'
+
+
+def byte_srt_pattern(encoding: str):
+    """
+    Compile a pattern that splits undecoded SRT text in a single-byte
+    encoding into dialogue and everything else, exactly like iter_cues and
+    convert_cues split the decoded text.
+
+    It matches cue headers (HEADER_RE) or markup (MARKUP_RE) in one scan,
+    with a single group, so pattern.split(data) alternates dialogue and
+    the rest. The two never overlap: markup cannot span a line break and
+    headers start at one. HEADER_RE's character classes are spelled out as
+    the bytes whose decoded characters they match.
+    """
+    decoded = {}
+    for b in range(256):
+        try:
+            decoded[b] = bytes([b]).decode(encoding)
+        except UnicodeDecodeError:
+            pass
+
+    def byte_class(char_pattern):
+        members = [re.escape(bytes([b])) for b, ch in decoded.items() if re.fullmatch(char_pattern, ch)]
+        return b'[' + b''.join(members) + b']'
+
+    space = r'[^\S\n]'
+    # A BOM character cannot occur in single-byte text
+    header = HEADER_RE.pattern.replace('\\ufeff?', '')
+    header = header.replace(space, '\0S').replace('\\d', '\0D').encode('ascii')
+    header = header.replace(b'\0S', byte_class(space)).replace(b'\0D', byte_class(r'\d'))
+    markup = MARKUP_RE.pattern.encode('ascii')
+    # Neither pattern has escaped parentheses, so every '(' that does not
+    # start an extension opens a group
+    source = b'(' + re.sub(rb'\((?!\?)', b'(?:', header + b'|' + markup) + b')'
+    return re.compile(source, re.M)
+
+
+def parse_cues(text: str) -> list:
+    """Split SRT text into Cue records with one regex scan."""
+    cues = []
+    index = ''
+    timing = ''
+    pos = 0
+    for match in HEADER_RE.finditer(text):
+        body = text[pos:match.start()]
+        if index or timing or body:
+            cues.append(Cue(index, timing, body))
+        index = match.group(1) or ''
+        timing = match.group(2)
+        pos = match.end()
+    body = text[pos:]
+    if index or timing or body:
+        cues.append(Cue(index, timing, body))
+    return cues
+
+
+def iter_cues(pieces, max_carry: int = 4 * 1024 * 1024):
+    """
+    Parse SRT text into Cue records.
+
+    pieces is an iterable of text pieces that end at line breaks (a whole
+    document is a single piece), so the parser also works as a stream. A
+    cue starts at each timing line, taking the cue number on the line
+    before it if there is one; its text runs up to the next cue, including
+    the blank separator lines. Anything before the first cue is a cue of
+    its own with an empty index and timing.
+    """
+    carry = ''
+    for piece in pieces:
+        cues = parse_cues(carry + piece)
+        if not cues:
+            carry = ''
+            continue
+        # The last cue may continue in the next piece (or its text may end
+        # with the number of the next cue), so parse it again with that
+        # piece - unless it grew too large to hold, e.g. text without cues
+        last = cues.pop()
+        carry = last.index + last.timing + last.text
+        if len(carry) > max_carry:
+            cues.append(last)
+            carry = ''
+        yield from cues
+    if carry:
+        yield from parse_cues(carry)
+
+
+def convert_pieces(pieces: list, convert) -> list:
+    """
+    Convert a list of text pieces with a single convert call.
+    The pieces are joined with SEPARATOR, which no converter touches: it is
+    neither a letter nor a word character, so no match can start, end or
+    run across it. Falls back to one call per piece if it occurs in the text.
+    """
+    joined = SEPARATOR.join(pieces)
+    if joined.count(SEPARATOR) == len(pieces) - 1:
+        converted = convert(joined).split(SEPARATOR)
+        if len(converted) == len(pieces):
+            return converted
+    return [convert(piece) for piece in pieces]
+
+
+def convert_cues(cues: list, convert):
+    """Yield the output pieces of cues with only their dialogue converted."""
+    # Dialogue at even indices, markup tags at odd ones
+    layouts = [
+        MARKUP_RE.split(cue.text) if '<' in cue.text or '{' in cue.text else [cue.text]
+        for cue in cues
+    ]
+    converted = convert_pieces([text for parts in layouts for text in parts[::2]], convert)
+
+    pos = 0
+    for cue, parts in zip(cues, layouts):
+        count = (len(parts) + 1) // 2
+        parts[::2] = converted[pos:pos + count]
+        pos += count
+        yield cue.index
+        yield cue.timing
+        yield ''.join(parts)
+
+
+def iter_converted_cues(cues, convert, batch_size: int = CUE_BATCH):
+    """Yield converted output for a stream of cues, batch by batch."""
+    batch = []
+    for cue in cues:
+        batch.append(cue)
+        if len(batch) >= batch_size:
+            yield from convert_cues(batch, convert)
+            batch = []
+    if batch:
+        yield from convert_cues(batch, convert)
+
+
+def convert_srt_text(text: str, convert) -> str:
+    """
+    Apply convert to the dialogue of an SRT document only.
+    Cue numbers, timings and markup tags are kept verbatim.
+    """
+    # Dialogue at even indices, headers and markup at odd ones. The line
+    # break added in front lets a header on the first line match.
+    parts = SRT_SPLIT_RE.split('\n' + text)
+    parts[::2] = convert_pieces(parts[::2], convert)
+    if parts[0]:
+        parts[0] = parts[0][1:]
+    else:
+        parts[1] = parts[1][1:]
+    return ''.join(parts)
+
+
+# =====================================================
+# STREAMING
+# =====================================================
+
+# Bytes inspected to pick an encoding before streaming
+SAMPLE_SIZE = 64 * 1024
+
+# Characters read per step when streaming
+CHUNK_SIZE = 1024 * 1024
+
+# Files larger than this are always streamed, even without --stream
+LARGE_FILE_SIZE = 64 * 1024 * 1024
+
+# Mapped pages already read are handed back to the OS this many bytes at a time
+RELEASE_SIZE = 16 * 1024 * 1024
+
+# Fallback cuts for text without line breaks (see find_cut): after the end
+# of a sentence, else after whitespace, else after punctuation
+SENTENCE_END_RE = re.compile(r'.*[.!?]\s', re.S)
+SPACE_END_RE = re.compile(r'.*\s', re.S)
+PUNCTUATION_END_RE = re.compile(r'.*[^\w\s]', re.S)
+WORD_END_RE = re.compile(r'\w+\Z')
+
+
+def detect_sample_encoding(sample: bytes, complete: bool = False) -> str:
+    """
+    Detect the encoding from the first bytes of a file.
+    Pass complete=True if the sample is the whole file.
+    """
+    encoding = detect_bom(sample)
+    if encoding:
+        return encoding
+
+    for encoding in ENCODINGS:
+        decoder = codecs.getincrementaldecoder(encoding)()
+        try:
+            # A multi-byte character cut at the end of the sample is not an error
+            decoder.decode(sample, final=complete)
+            return encoding
+        except (UnicodeDecodeError, UnicodeError):
+            continue
+
+    return 'utf-8'  # fallback
+
+
+class HashingReader(io.BufferedIOBase):
+    """Binary reader that hashes every byte handed to the layer above."""
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.sha = hashlib.sha256()
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        data = self.raw.read(size)
+        self.sha.update(data)
+        return data
+
+    def read1(self, size=-1):
+        data = self.raw.read1(size)
+        self.sha.update(data)
+        return data
+
+    def hexdigest(self) -> str:
+        return self.sha.hexdigest()
+
+
+def is_large_file(file_path: Path) -> bool:
+    """True if the file is too large to read into memory whole."""
+    try:
+        return os.path.getsize(file_path) > LARGE_FILE_SIZE
+    except OSError:
+        return False
+
+
+@contextmanager
+def map_file(file_path: Path):
+    """
+    Map a file read-only for sequential reading.
+    Yields None where it cannot be mapped (empty files, pipes and the like).
+    """
+    with open(file_path, 'rb') as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            mapped = None
+    if mapped is None:
+        yield None
+        return
+    with mapped:
+        if hasattr(mapped, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+            mapped.madvise(mmap.MADV_SEQUENTIAL)
+        yield mapped
+
+
+class MappedReader(io.BufferedIOBase):
+    """
+    Binary reader over a memory map. Pages it has handed out are released
+    again, so resident memory stays at a few chunks however large the
+    file is. Closing the reader leaves the map open.
+    """
+
+    def __init__(self, mapped: mmap.mmap):
+        self.mapped = mapped
+        self.released = 0
+        self.can_release = hasattr(mapped, 'madvise') and hasattr(mmap, 'MADV_DONTNEED')
+        mapped.seek(0)
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        data = self.mapped.read(size)
+        if self.can_release:
+            done = self.mapped.tell() - self.mapped.tell() % mmap.PAGESIZE
+            if done - self.released >= RELEASE_SIZE:
+                self.mapped.madvise(mmap.MADV_DONTNEED, self.released, done - self.released)
+                self.released = done
+        return data
+
+    read1 = read
+
+    def tell(self):
+        return self.mapped.tell()
+
+
+def find_cut(text: str, start: int, joined: frozenset = frozenset(), hold: str = '') -> int:
+    """
+    Where to cut text without line breaks, looking only past start; 0 to
+    read on. joined holds the lowercase words a multi-word dictionary key
+    goes on after, and hold the letters a digraph can start with. Without
+    a safe cut the text is cut anywhere but right after a letter in hold.
+    """
+    match = SENTENCE_END_RE.match(text, start)
+    if match:
+        return match.end()
+
+    # Whitespace right after a joined word may be inside a key like
+    # 'bit ću', so look further back; any other whitespace ends every key
+    longest = max(map(len, joined), default=0)
+    end = len(text)
+    while True:
+        match = SPACE_END_RE.match(text, start, end)
+        if not match:
+            break
+        cut = match.end()
+        word = WORD_END_RE.search(text, max(0, cut - longest - 2), cut - 1)
+        if word is None or word.group().lower() not in joined:
+            return cut
+        end = cut - 1
+
+    # Keys and digraphs are made of letters and spaces only
+    match = PUNCTUATION_END_RE.match(text, start)
+    if match:
+        return match.end()
+    cut = len(text)
+    while cut > start and text[cut - 1] in hold:
+        cut -= 1
+    return cut if cut > start else 0
+
+
+def iter_text_chunks(f, chunk_size: int = CHUNK_SIZE, joined: frozenset = frozenset(), hold: str = ''):
+    """
+    Yield text from f in pieces that end at safe boundaries.
+    Pieces end after a line break, so no digraph or multi-word dictionary
+    key is ever split between two pieces. A very long line without one is
+    cut where find_cut allows, looking only at its last chunk: memory stays
+    bounded and no text is scanned twice.
+    """
+    pending = ''
+    while True:
+        chunk = f.read(chunk_size)
+        if not chunk:
+            break
+        pending += chunk
+        cut = pending.rfind('\n') + 1
+        if not cut and len(pending) > 4 * chunk_size:
+            cut = find_cut(pending, len(pending) - len(chunk), joined, hold)
+        if cut:
+            yield pending[:cut]
+            pending = pending[cut:]
+    if pending:
+        yield pending
+
+
+def iter_converted_text(f, convert, srt: bool, chunk_size: int = CHUNK_SIZE,
+                        joined: frozenset = frozenset(), hold: str = ''):
+    """Yield converted output pieces for the text stream f."""
+    pieces = iter_text_chunks(f, chunk_size, joined, hold)
+    if srt:
+        # The cue parser itself works as a stream over the pieces
+        yield from iter_converted_cues(iter_cues(pieces), convert)
+    else:
+        for piece in pieces:
+            yield convert(piece)
+
+
+def stream_convert(input_path: Path, output_path: Path, convert, srt: bool = True,
+                   chunk_size: int = CHUNK_SIZE, on_restart=None, stats=None,
+                   joined: frozenset = frozenset(), hold: str = '') -> tuple:
+    """
+    Convert a file piece by piece with memory independent of its size.
+
+    The input is read from a memory map where possible (see MappedReader)
+    and the output written as it is produced. The encoding is guessed
+    from the first SAMPLE_SIZE bytes; if a later part turns out not to
+    decode, conversion restarts with the next candidate, so the result
+    matches read_text(). The output is written as UTF-8 with BOM to a
+    temporary file and renamed into place at the end, which also makes it
+    safe to convert a file onto itself.
+    on_restart is called before such a restart, so callers can reset
+    anything they accumulate in convert. joined and hold keep long lines
+    from being cut inside a dictionary key or digraph (see find_cut).
+    Reading, decoding and parsing are interleaved with the other stages,
+    so with stats the time spent outside convert and write is counted as
+    'read'.
+
+    Returns:
+        Tuple of (encoding: str, sha256 of the input: str)
+    """
+    stats = stats or NO_STATS
+    convert = stats.timed('convert', convert)
+    tmp_path = output_path.with_name(f"{output_path.name}.tmp-{os.getpid()}")
+    try:
+        with map_file(input_path) as mapped:
+            with stats.time('detect'):
+                if mapped is None:
+                    with open(input_path, 'rb') as f:
+                        sample = f.read(SAMPLE_SIZE + 1)
+                else:
+                    sample = mapped[:SAMPLE_SIZE + 1]
+                encoding = detect_sample_encoding(sample[:SAMPLE_SIZE], len(sample) <= SAMPLE_SIZE)
+
+            candidates = [encoding]
+            if encoding in ENCODINGS:
+                candidates = ENCODINGS[ENCODINGS.index(encoding):]
+
+            for i, encoding in enumerate(candidates):
+                last = i == len(candidates) - 1
+                with (open(input_path, 'rb') if mapped is None else MappedReader(mapped)) as raw:
+                    reader = HashingReader(raw)
+                    source = io.TextIOWrapper(reader, encoding=encoding,
+                                              errors='replace' if last else 'strict')
+                    start = time.perf_counter()
+                    spent = stats.elapsed('convert', 'write')
+                    try:
+                        with open(tmp_path, 'w', encoding='utf-8-sig') as out:
+                            write = stats.timed('write', out.write)
+                            for piece in iter_converted_text(source, convert, srt, chunk_size, joined, hold):
+                                write(piece)
+                    except (UnicodeDecodeError, UnicodeError):
+                        if last:
+                            raise
+                        if on_restart:
+                            on_restart()
+                        stats.count('restarts')
+                        continue
+                    finally:
+                        spent = stats.elapsed('convert', 'write') - spent
+                        stats.add_time('read', time.perf_counter() - start - spent)
+                    stats.count('bytes_in', raw.tell())
+                    break
+
+        # Only once the map is closed: a mapped file cannot be replaced on Windows
+        os.replace(tmp_path, output_path)
+        stats.count('bytes_out', os.path.getsize(output_path))
+        return encoding, reader.hexdigest()
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+# =====================================================
+# ASYNC PIPELINE
+# =====================================================
+
+# Files allowed between discovery and reporting at once; bounds memory
+# to about this many files' contents however large the directory is
+PIPELINE_IN_FLIGHT = 64
+
+# Threads for discovery, reads and writes. They mostly wait on the disk,
+# but every extra thread also competes with conversion for the GIL
+PIPELINE_IO_THREADS = 4
+
+
+def timed_call(func, *args) -> tuple:
+    """Call func and return (result, seconds); runs in worker processes too."""
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+class PipelineJob:
+    """One item on its way through the pipeline."""
+
+    __slots__ = ('seq', 'item', 'value', 'error', 'stats')
+
+    def __init__(self, seq: int, item, stats):
+        self.seq = seq
+        self.item = item
+        self.value = None
+        self.error = None
+        self.stats = stats
+
+
+async def run_pipeline_async(items, read, convert, write, report, jobs: int = 1,
+                             in_flight: int = PIPELINE_IN_FLIGHT,
+                             io_threads: int = PIPELINE_IO_THREADS, instrument: bool = False,
+                             initializer=None, initargs=()) -> int:
+    """
+    Run items through discover -> read -> convert -> write stages that
+    overlap each other, connected by bounded queues.
+
+    items is iterated in an I/O thread, so it may be a lazy generator that
+    touches the disk. For every item, read(item, stats) and
+    write(item, value, stats) run in I/O threads, convert(value) in a
+    process pool of jobs workers (a single thread if jobs <= 1); convert
+    and its arguments must be picklable. report(item, result, error, stats)
+    is called in item order; error is the exception raised by any stage
+    (and result None then). stats is a Stats per item with instrument,
+    else NO_STATS. Items are expected to start with their input path.
+
+    At most in_flight items are between discovery and reporting at any
+    time, so a slow stage holds back discovery instead of piling up data.
+
+    Returns:
+        The number of items processed
+    """
+    import asyncio
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+    loop = asyncio.get_running_loop()
+    io_pool = ThreadPoolExecutor(max_workers=io_threads)
+    if jobs > 1:
+        convert_pool = ProcessPoolExecutor(max_workers=jobs, initializer=initializer, initargs=initargs)
+    else:
+        if initializer:
+            initializer(*initargs)
+        convert_pool = ThreadPoolExecutor(max_workers=1)
+    read_workers = write_workers = max(1, io_threads // 2)
+    convert_workers = max(1, jobs)
+
+    slots = asyncio.Semaphore(in_flight)
+    read_queue = asyncio.Queue(in_flight)
+    convert_queue = asyncio.Queue(in_flight)
+    write_queue = asyncio.Queue(in_flight)
+    report_queue = asyncio.Queue(in_flight)
+    count = 0
+
+    async def discover():
+        nonlocal count
+        iterator = iter(items)
+        done = object()
+        while True:
+            await slots.acquire()
+            item = await loop.run_in_executor(io_pool, next, iterator, done)
+            if item is done:
+                slots.release()
+                break
+            stats = Stats(item[0]) if instrument else NO_STATS
+            await read_queue.put(PipelineJob(count, item, stats))
+            count += 1
+
+    async def stage(name, queue, run, workers, next_queue, next_workers):
+        async def worker():
+            while True:
+                job = await queue.get()
+                if job is None:
+                    return
+                if job.error is None:
+                    try:
+                        job.value, seconds = await run(job)
+                        job.stats.add_time(name, seconds)
+                    except Exception as e:
+                        job.error = e
+                await next_queue.put(job)
+
+        await asyncio.gather(*(worker() for _ in range(workers)))
+        # Every worker of the next stage stops at its own end marker
+        for _ in range(next_workers):
+            await next_queue.put(None)
+
+    def run_read(job):
+        return loop.run_in_executor(io_pool, timed_call, read, job.item, job.stats)
+
+    def run_convert(job):
+        return loop.run_in_executor(convert_pool, timed_call, convert, job.value)
+
+    def run_write(job):
+        return loop.run_in_executor(io_pool, timed_call, write, job.item, job.value, job.stats)
+
+    async def reorder():
+        # Report strictly in item order; a slot is freed once reported
+        pending = {}
+        next_seq = 0
+        while True:
+            job = await report_queue.get()
+            if job is None:
+                break
+            pending[job.seq] = job
+            while next_seq in pending:
+                job = pending.pop(next_seq)
+                report(job.item, None if job.error else job.value, job.error, job.stats)
+                next_seq += 1
+                slots.release()
+
+    async def discover_stage():
+        await discover()
+        for _ in range(read_workers):
+            await read_queue.put(None)
+
+    try:
+        await asyncio.gather(
+            discover_stage(),
+            stage('read', read_queue, run_read, read_workers, convert_queue, convert_workers),
+            stage('convert', convert_queue, run_convert, convert_workers, write_queue, write_workers),
+            stage('write', write_queue, run_write, write_workers, report_queue, 1),
+            reorder(),
+        )
+    finally:
+        io_pool.shutdown()
+        convert_pool.shutdown()
+    return count
+
+
+def run_pipeline(items, read, convert, write, report, **kwargs) -> int:
+    """Run run_pipeline_async to completion from synchronous code."""
+    # Imported here: asyncio alone takes longer to import than a short run
+    import asyncio
+    return asyncio.run(run_pipeline_async(items, read, convert, write, report, **kwargs))
+
+
+def pool_map(func, *sequences, jobs: int = 1, initializer=None, initargs=()):
+    """
+    Like map() over equally long sequences, in a process pool if jobs > 1.
+    Yields the results in order; func must be picklable (a module-level
+    function or a partial of one).
+    """
+    count = len(sequences[0])
+    if jobs <= 1 or count <= 1:
+        yield from map(func, *sequences)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    # Batch small files per worker round trip, but keep results flowing
+    chunksize = max(1, min(64, count // (jobs * 4)))
+    with ProcessPoolExecutor(max_workers=jobs, initializer=initializer, initargs=initargs) as executor:
+        yield from executor.map(func, *sequences, chunksize=chunksize)
+
+
+def print_result(encoding: str, error: str):
+    """Print the per-file details reported by convert_srt and translate_path."""
+    if encoding:
+        print(f"  Detected encoding: {encoding}")
+    if error:
+        print(f"  Error: {error}")
+
+
+# =====================================================
+# LIBRARY ENGINES
+# =====================================================
+
+class Engine:
+    """
+    Base class of the reusable conversion engines.
+
+    Subclasses build their tables once in __init__ and implement convert().
+    Nothing is modified afterwards and nothing is printed, so one instance
+    can be shared by any number of threads and called in a hot loop.
+    """
+
+    # Passed to stream_convert, see find_cut
+    joined = frozenset()
+    hold = ''
+
+    def convert(self, text: str) -> str:
+        """Convert a text string."""
+        raise NotImplementedError
+
+    def convert_bytes(self, data: bytes, srt: bool = False) -> str:
+        """
+        Decode raw file contents with the detected encoding and convert them.
+        With srt=True only the dialogue of SRT cues is converted.
+        """
+        text, _ = decode_bytes(data)
+        return convert_srt_text(text, self.convert) if srt else self.convert(text)
+
+    def convert_file(self, input_path: Path, output_path: Path, srt: bool = None,
+                     stream: bool = False) -> str:
+        """
+        Convert a file and write the result as UTF-8 with BOM.
+        srt defaults to True for .srt files; stream=True keeps memory bounded
+        (files over LARGE_FILE_SIZE are always streamed). Errors are raised,
+        not printed.
+
+        Returns:
+            The detected encoding of the input
+        """
+        input_path = Path(input_path)
+        output_path = Path(output_path)
+        if srt is None:
+            srt = input_path.suffix.lower() == '.srt'
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        if stream or is_large_file(input_path):
+            encoding, _ = stream_convert(input_path, output_path, self.convert, srt,
+                                         joined=self.joined, hold=self.hold)
+            return encoding
+
+        text, encoding = read_text(input_path)
+        converted = convert_srt_text(text, self.convert) if srt else self.convert(text)
+        with open(output_path, 'w', encoding='utf-8-sig') as f:
+            f.write(converted)
+        return encoding
+
+    def convert_many(self, texts, batch_size: int = CUE_BATCH):
+        """
+        Convert an iterable of strings, yielding the results in order.
+        Strings are converted batch_size at a time in a single call.
+        """
+        batch = []
+        for text in texts:
+            batch.append(text)
+            if len(batch) >= batch_size:
+                yield from convert_pieces(batch, self.convert)
+                batch = []
+        if batch:
+            yield from convert_pieces(batch, self.convert)
+
+
+# =====================================================
+# INSTRUMENTATION
+# =====================================================
+
+# Stages in report order; stages not listed here follow in name order
+STAGES = ['check', 'move', 'detect', 'read', 'convert', 'write', 'cache']
+
+
+class Stats:
+    """
+    Timings (seconds per stage) and counters of one file.
+    Picklable, so worker processes can hand them back with their results.
+    """
+
+    def __init__(self, path=None):
+        self.path = str(path) if path is not None else None
+        self.status = None
+        self.timings = {}
+        self.counters = {}
+
+    @contextmanager
+    def time(self, stage: str):
+        """Context manager adding the time spent in its block to stage."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(stage, time.perf_counter() - start)
+
+    def timed(self, stage: str, func):
+        """Wrap func so that the time spent in every call is added to stage."""
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.add_time(stage, time.perf_counter() - start)
+        return wrapper
+
+    def add_time(self, stage: str, seconds: float):
+        self.timings[stage] = self.timings.get(stage, 0.0) + seconds
+
+    def elapsed(self, *stages) -> float:
+        """Total time recorded so far for the given stages."""
+        return sum(self.timings.get(stage, 0.0) for stage in stages)
+
+    def count(self, name: str, n: int = 1):
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def to_dict(self) -> dict:
+        return {'file': self.path, 'status': self.status,
+                'timings': self.timings, 'counters': self.counters}
+
+
+class NullStats(Stats):
+    """Stats that record nothing, used while instrumentation is off."""
+
+    def time(self, stage: str):
+        return nullcontext()
+
+    def timed(self, stage: str, func):
+        return func
+
+    def add_time(self, stage: str, seconds: float):
+        pass
+
+    def count(self, name: str, n: int = 1):
+        pass
+
+
+NO_STATS = NullStats()
+
+
+class StatsReport:
+    """
+    Collects the Stats of a run, from any thread.
+    Every file becomes one line of the optional JSON-lines log, followed by
+    a final summary line; only the totals are kept in memory.
+    """
+
+    def __init__(self, tool: str, log_path: Path = None):
+        self.tool = tool
+        self.start = time.perf_counter()
+        self.files = 0
+        self.statuses = {}
+        self.timings = {}
+        self.stage_files = {}
+        self.counters = {}
+        self.log = open(log_path, 'w', encoding='utf-8') if log_path else None
+        self.lock = threading.Lock()
+
+    def add(self, stats: Stats):
+        """Add the Stats of one file to the totals and the log."""
+        with self.lock:
+            self._add(stats)
+
+    def _add(self, stats: Stats):
+        self.files += 1
+        self.statuses[stats.status] = self.statuses.get(stats.status, 0) + 1
+        for stage, seconds in stats.timings.items():
+            self.timings[stage] = self.timings.get(stage, 0.0) + seconds
+            self.stage_files[stage] = self.stage_files.get(stage, 0) + 1
+        for name, n in stats.counters.items():
+            self.counters[name] = self.counters.get(name, 0) + n
+        if self.log:
+            self.log.write(json.dumps(dict(tool=self.tool, **stats.to_dict()), ensure_ascii=False) + '\n')
+
+    def stages(self) -> list:
+        """Recorded stages in report order."""
+        return sorted(self.timings, key=lambda s: (STAGES.index(s) if s in STAGES else len(STAGES), s))
+
+    def summary(self) -> dict:
+        return {
+            'tool': self.tool,
+            'summary': True,
+            'wall_seconds': time.perf_counter() - self.start,
+            'files': self.files,
+            'statuses': self.statuses,
+            'timings': {stage: self.timings[stage] for stage in self.stages()},
+            'counters': self.counters,
+        }
+
+    def close(self):
+        """Write the summary line and close the log."""
+        if self.log:
+            self.log.write(json.dumps(self.summary(), ensure_ascii=False) + '\n')
+            self.log.close()
+            self.log = None
+
+    def print_summary(self):
+        """Print the totals as a table."""
+        summary = self.summary()
+        total = sum(self.timings.values())
+        print(f"\n{'Stage':<10} {'Files':>7} {'Total s':>10} {'Mean ms':>10} {'Share':>7}")
+        for stage in self.stages():
+            seconds = self.timings[stage]
+            files = self.stage_files[stage]
+            share = seconds / total if total else 0.0
+            print(f"{stage:<10} {files:>7} {seconds:>10.3f} {seconds / files * 1000:>10.2f} {share:>7.1%}")
+        print(f"{'total':<10} {self.files:>7} {total:>10.3f}")
+        for name in sorted(self.counters):
+            print(f"  {name}: {self.counters[name]:,}")
+        statuses = ', '.join(f"{status}: {n}" for status, n in sorted(self.statuses.items(), key=str))
+        print(f"  files: {statuses or 0}")
+        print(f"  wall time: {summary['wall_seconds']:.3f} s (stage times add up across workers)")
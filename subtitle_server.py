@@ -0,0 +1,285 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Subtitle conversion server
+Keeps the Latin to Cyrillic and Croatian to Serbian engines warm in one
+process and converts SRT files or plain text sent over HTTP, on a TCP port
+or a Unix socket.
+"""
+
+import os
+import sys
+import json
+import stat
+import time
+import socket
+import threading
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from socketserver import ThreadingMixIn, UnixStreamServer
+from urllib.parse import parse_qs, urlsplit
+
+from subtitle_io import HEADER_RE, convert_srt_text, decode_bytes
+from convert_to_cyrillic import Transliterator
+from translate_croatian_to_serbian import DEFAULT_MATCHER, MATCHERS, Translator
+
+# Largest accepted request body (--max-body, in MB)
+DEFAULT_MAX_BODY_MB = 64
+
+# Latencies kept per endpoint for the percentiles
+LATENCY_WINDOW = 10000
+
+PERCENTILES = [50, 90, 95, 99]
+
+
+class LatencyStats:
+    """Request counts and a sliding window of latencies per endpoint, thread-safe."""
+
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self.window = window
+        self.lock = threading.Lock()
+        self.started = time.time()
+        self.latencies = {}
+        self.counts = {}
+        self.errors = {}
+
+    def record(self, endpoint: str, seconds: float, ok: bool = True):
+        with self.lock:
+            if endpoint not in self.latencies:
+                self.latencies[endpoint] = deque(maxlen=self.window)
+                self.counts[endpoint] = 0
+                self.errors[endpoint] = 0
+            self.latencies[endpoint].append(seconds)
+            self.counts[endpoint] += 1
+            if not ok:
+                self.errors[endpoint] += 1
+
+    def summary(self) -> dict:
+        """Counts and latency percentiles in milliseconds per endpoint."""
+        with self.lock:
+            snapshot = {endpoint: sorted(values) for endpoint, values in self.latencies.items()}
+            counts = dict(self.counts)
+            errors = dict(self.errors)
+
+        endpoints = {}
+        for endpoint, values in snapshot.items():
+            # Nearest-rank percentiles over the window
+            latency = {
+                f"p{p}": values[max(0, -(-p * len(values) // 100) - 1)] * 1000
+                for p in PERCENTILES
+            }
+            latency['max'] = values[-1] * 1000
+            latency['mean'] = sum(values) / len(values) * 1000
+            endpoints[endpoint] = {
+                'requests': counts[endpoint],
+                'errors': errors[endpoint],
+                'window': len(values),
+                'latency_ms': latency,
+            }
+        return {'uptime_s': time.time() - self.started, 'endpoints': endpoints}
+
+
+class ConversionHandler(BaseHTTPRequestHandler):
+    """
+    POST /cyrillic  - Latin to Cyrillic
+    POST /serbian   - Croatian to Serbian vocabulary
+    GET  /stats     - request counts and latency percentiles as JSON
+    GET  /health    - 'ok'
+
+    The body is a subtitle file or text in any supported encoding. Only the
+    dialogue of SRT input is converted; ?format=srt or ?format=text
+    overrides the detection. The result is returned as UTF-8.
+    """
+
+    protocol_version = 'HTTP/1.1'
+    server_version = 'Cyrillio'
+
+    def address_string(self):
+        # Unix socket peers have no address
+        return self.client_address[0] if self.client_address else 'unix'
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def send_body(self, status: int, body: bytes, content_type: str = 'text/plain; charset=utf-8'):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_error_text(self, status: int, message: str):
+        self.send_body(status, (message + '\n').encode('utf-8'))
+
+    def do_GET(self):
+        path = urlsplit(self.path).path
+        if path == '/stats':
+            body = json.dumps(self.server.latency.summary(), indent=1).encode('utf-8')
+            self.send_body(200, body, 'application/json')
+        elif path == '/health':
+            self.send_body(200, b'ok\n')
+        else:
+            self.send_error_text(404, f"Unknown endpoint: {path}")
+
+    def do_POST(self):
+        start = time.perf_counter()
+        url = urlsplit(self.path)
+        engine = self.server.engines.get(url.path)
+        if engine is None:
+            # The body is not read, so it must not be taken for the next request
+            self.close_connection = True
+            self.send_error_text(404, f"Unknown endpoint: {url.path}")
+            return
+
+        ok = False
+        try:
+            try:
+                length = int(self.headers.get('Content-Length', ''))
+            except ValueError:
+                self.send_error_text(411, "Content-Length required")
+                self.close_connection = True
+                return
+            if length < 0:
+                self.send_error_text(400, f"Invalid Content-Length: {length}")
+                self.close_connection = True
+                return
+            if length > self.server.max_body:
+                self.send_error_text(413, f"Body larger than {self.server.max_body} bytes")
+                self.close_connection = True
+                return
+
+            data = self.rfile.read(length)
+            text, encoding = decode_bytes(data)
+            fmt = parse_qs(url.query).get('format', ['auto'])[0]
+            if fmt == 'auto':
+                srt = HEADER_RE.search(text) is not None
+            elif fmt in ('srt', 'text'):
+                srt = fmt == 'srt'
+            else:
+                self.send_error_text(400, f"Unknown format: {fmt} (choose from: auto, srt, text)")
+                return
+
+            converted = convert_srt_text(text, engine.convert) if srt else engine.convert(text)
+            body = converted.encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/plain; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.send_header('X-Detected-Encoding', encoding)
+            self.end_headers()
+            self.wfile.write(body)
+            ok = True
+        except Exception as e:
+            self.send_error_text(500, f"Error: {e}")
+        finally:
+            self.server.latency.record(url.path, time.perf_counter() - start, ok)
+
+
+class ThreadingUnixHTTPServer(ThreadingMixIn, UnixStreamServer):
+    """HTTP server on a Unix socket, one thread per connection."""
+
+    daemon_threads = True
+
+    def server_bind(self):
+        # Replace a stale socket file left behind by an earlier run, but
+        # never anything else that happens to be at that path
+        try:
+            mode = os.lstat(self.server_address).st_mode
+        except FileNotFoundError:
+            pass
+        else:
+            if not stat.S_ISSOCK(mode):
+                raise FileExistsError(f"Not a socket, refusing to replace it: {self.server_address}")
+            os.remove(self.server_address)
+        super().server_bind()
+
+
+def make_server(host: str = '127.0.0.1', port: int = 8080, unix_socket: str = None,
+                matcher: str = None, max_body: int = DEFAULT_MAX_BODY_MB * 1024 * 1024,
+                verbose: bool = False):
+    """Build the server with warm engines; call serve_forever() on it."""
+    if unix_socket:
+        server = ThreadingUnixHTTPServer(unix_socket, ConversionHandler)
+    else:
+        server = ThreadingHTTPServer((host, port), ConversionHandler)
+        server.daemon_threads = True
+
+    # Engines are built once and shared by all request threads
+    server.engines = {
+        '/cyrillic': Transliterator(),
+        '/serbian': Translator(matcher=matcher),
+    }
+    server.latency = LatencyStats()
+    server.max_body = max_body
+    server.verbose = verbose
+    return server
+
+
+def main():
+    """Run the conversion server until interrupted."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description='Serve Latin to Cyrillic and Croatian to Serbian conversion over HTTP'
+    )
+    parser.add_argument(
+        '--host',
+        default='127.0.0.1',
+        help='Address to listen on (default: 127.0.0.1)'
+    )
+    parser.add_argument(
+        '-p', '--port',
+        type=int,
+        default=8080,
+        help='TCP port to listen on (default: 8080)'
+    )
+    parser.add_argument(
+        '--socket',
+        metavar='PATH',
+        help='Listen on a Unix socket instead of a TCP port'
+    )
+    parser.add_argument(
+        '--matcher',
+        choices=sorted(MATCHERS),
+        default=DEFAULT_MATCHER,
+        help=f'Dictionary matcher backend (default: {DEFAULT_MATCHER})'
+    )
+    parser.add_argument(
+        '--max-body',
+        type=int,
+        default=DEFAULT_MAX_BODY_MB,
+        help=f'Largest accepted request body in MB (default: {DEFAULT_MAX_BODY_MB})'
+    )
+    parser.add_argument(
+        '-v', '--verbose',
+        action='store_true',
+        help='Log every request'
+    )
+
+    args = parser.parse_args()
+    if args.socket and not hasattr(socket, 'AF_UNIX'):
+        print("Error: Unix sockets are not supported on this platform")
+        return 1
+
+    try:
+        server = make_server(args.host, args.port, args.socket, args.matcher,
+                             args.max_body * 1024 * 1024, args.verbose)
+    except OSError as e:
+        print(f"Error: {e}")
+        return 1
+    where = args.socket or f"http://{args.host}:{server.server_address[1]}"
+    print(f"Serving on {where} (POST /cyrillic, POST /serbian, GET /stats)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if args.socket and os.path.exists(args.socket):
+            os.remove(args.socket)
+        print("\nLatency:", json.dumps(server.latency.summary()['endpoints']))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -7,1839 +7,1117 @@ Converts Croatian vocabulary to Serbian equivalents in .srt files
 
 import os
 import re
+import csv
+import json
+import time
+import shutil
+import marshal
+import hashlib
+from functools import partial
+from itertools import accumulate
 from pathlib import Path
 
-# Croatian to Serbian word mappings
-# Format: 'Croatian word': 'Serbian word'
-CROATIAN_TO_SERBIAN = {
-    # =====================================================
-    # LOCATION/PLACE ADVERBS (ovdje, gdje, etc.)
-    # =====================================================
-    'ovdje': 'ovde',
-    'Ovdje': 'Ovde',
-    'gdje': 'gde',
-    'Gdje': 'Gde',
-    'negdje': 'negde',
-    'Negdje': 'Negde',
-    'nigdje': 'nigde',
-    'Nigdje': 'Nigde',
-    'svugdje': 'svugde',
-    'Svugdje': 'Svugde',
-    'igdje': 'igde',
-    'Igdje': 'Igde',
-    'ondje': 'onde',
-    'Ondje': 'Onde',
-    'odakle': 'odakle',
-    'dokle': 'dokle',
-    
-    # =====================================================
-    # TIME ADVERBS (uvijek, prije, poslije)
-    # =====================================================
-    'uvijek': 'uvek',
-    'Uvijek': 'Uvek',
-    'zauvijek': 'zauvek',
-    'Zauvijek': 'Zauvek',
-    'prije': 'pre',
-    'Prije': 'Pre',
-    'poslije': 'posle',
-    'Poslije': 'Posle',
-    'najprije': 'najpre',
-    'Najprije': 'Najpre',
-    
-    # =====================================================
-    # SEE/WATCH (vidjeti -> videti)
-    # =====================================================
-    'vidjeti': 'videti',
-    'vidio': 'video',
-    'vidjela': 'videla',
-    'vidjeli': 'videli',
-    'vidjelo': 'videlo',
-    'Vidjeti': 'Videti',
-    'Vidio': 'Video',
-    'Vidjela': 'Videla',
-    'Vidjeli': 'Videli',
-    
-    # =====================================================
-    # FEEL (osjećati -> osećati)
-    # =====================================================
-    'osjećati': 'osećati',
-    'osjećam': 'osećam',
-    'osjećaš': 'osećaš',
-    'osjeća': 'oseća',
-    'osjećamo': 'osećamo',
-    'osjećate': 'osećate',
-    'osjećaju': 'osećaju',
-    'Osjećam': 'Osećam',
-    'Osjećaš': 'Osećaš',
-    'Osjeća': 'Oseća',
-    'osjećaj': 'osećaj',
-    'osjećaja': 'osećaja',
-    'osjećaje': 'osećaje',
-    'osjećajima': 'osećajima',
-    'Osjećaj': 'Osećaj',
-    
-    # =====================================================
-    # REMEMBER (sjećati -> sećati)
-    # =====================================================
-    'sjećati': 'sećati',
-    'sjećam': 'sećam',
-    'sjećaš': 'sećaš',
-    'sjeća': 'seća',
-    'sjećamo': 'sećamo',
-    'sjećate': 'sećate',
-    'sjećaju': 'sećaju',
-    'Sjećam': 'Sećam',
-    'Sjećaš': 'Sećaš',
-    'Sjećate': 'Sećate',
-    'sjećanje': 'sećanje',
-    'sjećanja': 'sećanja',
-    'Sjećanje': 'Sećanje',
-    'sjetiti': 'setiti',
-    'sjetio': 'setio',
-    'sjetila': 'setila',
-    'sjetili': 'setili',
-    'sjeti': 'seti',
-    
-    # =====================================================
-    # LIVE (živjeti -> živeti)
-    # =====================================================
-    'živjeti': 'živeti',
-    'živio': 'živeo',
-    'živjela': 'živela',
-    'živjeli': 'živeli',
-    'živjelo': 'živelo',
-    'Živjeti': 'Živeti',
-    'Živio': 'Živeo',
-    'Živjela': 'Živela',
-    'Živjeli': 'Živeli',
-    
-    # =====================================================
-    # LOVE (voljeti -> voleti)
-    # =====================================================
-    'voljeti': 'voleti',
-    'volio': 'voleo',
-    'voljela': 'volela',
-    'voljeli': 'voleli',
-    'voljelo': 'volelo',
-    'Voljeti': 'Voleti',
-    'Volio': 'Voleo',
-    'Voljela': 'Volela',
-    'Voljeli': 'Voleli',
-    
-    # =====================================================
-    # HAPPY (sretan -> srećan)
-    # =====================================================
-    'sretan': 'srećan',
-    'sretna': 'srećna',
-    'sretno': 'srećno',
-    'sretni': 'srećni',
-    'sretne': 'srećne',
-    'sretnog': 'srećnog',
-    'sretnoj': 'srećnoj',
-    'Sretan': 'Srećan',
-    'Sretna': 'Srećna',
-    'Sretno': 'Srećno',
-    'sreća': 'sreća',
-    'sreće': 'sreće',
-    'sreći': 'sreći',
-    'srećom': 'srećom',
-    
-    # =====================================================
-    # LABORATORY (laboratorij -> laboratorija)
-    # =====================================================
-    'laboratorij': 'laboratorija',
-    'laboratorija': 'laboratorije',
-    'laboratoriju': 'laboratoriji',
-    'Laboratorij': 'Laboratorija',
-    
-    # =====================================================
-    # VISITOR (posjetitelj -> posetilac)
-    # =====================================================
-    'posjetitelj': 'posetilac',
-    'posjetitelja': 'posetioca',
-    'posjetitelju': 'posetiocu',
-    'posjetitelji': 'posetioci',
-    'posjetitelje': 'posetioce',
-    'Posjetitelj': 'Posetilac',
-    'posjetiti': 'posetiti',
-    'posjetio': 'posetio',
-    'posjetila': 'posetila',
-    'posjetili': 'posetili',
-    'posjet': 'poseta',
-    'posjeta': 'posete',
-    'posjetu': 'posetu',
-    'posjetom': 'posetom',
-    
-    # =====================================================
-    # BEAUTIFUL (lijep -> lep)
-    # =====================================================
-    'lijep': 'lep',
-    'lijepa': 'lepa',
-    'lijepo': 'lepo',
-    'lijepi': 'lepi',
-    'lijepe': 'lepe',
-    'lijepog': 'lepog',
-    'lijepoj': 'lepoj',
-    'lijepom': 'lepom',
-    'Lijep': 'Lep',
-    'Lijepa': 'Lepa',
-    'Lijepo': 'Lepo',
-    'ljepota': 'lepota',
-    'ljepote': 'lepote',
-    'ljepoti': 'lepoti',
-    'ljepotom': 'lepotom',
-    'Ljepota': 'Lepota',
-    'ljepotan': 'lepotan',
-    'ljepotana': 'lepotana',
-    'ljepotanu': 'lepotanu',
-    'Ljepotan': 'Lepotan',
-    
-    # =====================================================
-    # SHADOW (sjena -> senka)
-    # =====================================================
-    'sjena': 'senka',
-    'sjene': 'senke',
-    'sjeni': 'senci',
-    'sjenom': 'senkom',
-    'sjenu': 'senku',
-    'Sjena': 'Senka',
-    'Sjene': 'Senke',
-    
-    # =====================================================
-    # BLADDER/BUBBLE (mjehur -> mehur)
-    # =====================================================
-    'mjehur': 'mehur',
-    'mjehura': 'mehura',
-    'mjehuru': 'mehuru',
-    'mjehurom': 'mehurom',
-    'mjehuri': 'mehuri',
-    'Mjehur': 'Mehur',
-    
-    # =====================================================
-    # FUNNY (smiješan -> smešan)
-    # =====================================================
-    'smiješan': 'smešan',
-    'smiješna': 'smešna',
-    'smiješno': 'smešno',
-    'smiješni': 'smešni',
-    'smiješne': 'smešne',
-    'Smiješan': 'Smešan',
-    'Smiješna': 'Smešna',
-    'Smiješno': 'Smešno',
-    
-    # =====================================================
-    # LAUGH (smijeh -> smeh)
-    # =====================================================
-    'smijeh': 'smeh',
-    'smijeha': 'smeha',
-    'smijehu': 'smehu',
-    'smijehom': 'smehom',
-    'Smijeh': 'Smeh',
-    'smijati': 'smejati',
-    'smijem': 'smejem',
-    'smiješ': 'smeješ',
-    
-    # =====================================================
-    # ERROR (greška - same, but pogreška -> greška)
-    # =====================================================
-    'pogreška': 'greška',
-    'pogreške': 'greške',
-    'pogrešku': 'grešku',
-    'pogreškom': 'greškom',
-    'pogreški': 'greški',
-    'Pogreška': 'Greška',
-    
-    # =====================================================
-    # CROATIAN FUTURE TENSE (bit ću -> biću)
-    # =====================================================
-    'bit ću': 'biću',
-    'Bit ću': 'Biću',
-    'bit ćeš': 'bićeš',
-    'Bit ćeš': 'Bićeš',
-    'bit će': 'biće',
-    'Bit će': 'Biće',
-    'bit ćemo': 'bićemo',
-    'Bit ćemo': 'Bićemo',
-    'bit ćete': 'bićete',
-    'Bit ćete': 'Bićete',
-    
-    # =====================================================
-    # FUTURE TENSE with voljeti (Voljet će -> Voleće)
-    # =====================================================
-    'voljet ću': 'voleću',
-    'Voljet ću': 'Voleću',
-    'voljet ćeš': 'volećeš',
-    'Voljet ćeš': 'Volećeš',
-    'voljet će': 'voleće',
-    'Voljet će': 'Voleće',
-    'voljet ćemo': 'volećemo',
-    'Voljet ćemo': 'Volećemo',
-    
-    # =====================================================
-    # FUTURE TENSE - verbs ending in -at/-it + ću/će/ćemo/ćete
-    # =====================================================
-    # Show (Pokazat ću -> Pokazaću)
-    'pokazat ću': 'pokazaću',
-    'Pokazat ću': 'Pokazaću',
-    'pokazat ćeš': 'pokazaćeš',
-    'pokazat će': 'pokazaće',
-    'pokazat ćemo': 'pokazaćemo',
-    'pokazat ćete': 'pokazaćete',
-    
-    # Return (Vratit ću -> Vratiću)
-    'vratit ću': 'vratiću',
-    'Vratit ću': 'Vratiću',
-    'vratit ćeš': 'vratićeš',
-    'vratit će': 'vratiće',
-    'vratit ćemo': 'vratićemo',
-    'vratit ćete': 'vratićete',
-    'Vratit ćeš': 'Vratićeš',
-    
-    # Have to (Morat ću -> Moraću)
-    'morat ću': 'moraću',
-    'Morat ću': 'Moraću',
-    'morat ćeš': 'moraćeš',
-    'morat će': 'moraće',
-    'morat ćemo': 'moraćemo',
-    'morat ćete': 'moraćete',
-    
-    # Explode (Eksplodirat će -> Eksplodiraće)
-    'eksplodirat ću': 'eksplodiraću',
-    'eksplodirat ćeš': 'eksplodiraćeš',
-    'eksplodirat će': 'eksplodiraće',
-    'Eksplodirat će': 'Eksplodiraće',
-    'eksplodirat ćemo': 'eksplodiraćemo',
-    'eksplodirat ćete': 'eksplodiraćete',
-    
-    # Overload (Preopteretit ćete -> Preopteretićete)
-    'preopteretit ću': 'preopteretiću',
-    'preopteretit ćeš': 'preopteretićeš',
-    'preopteretit će': 'preopteretiće',
-    'preopteretit ćemo': 'preopteretićemo',
-    'preopteretit ćete': 'preopteretićete',
-    'Preopteretit ćete': 'Preopteretićete',
-    
-    # Mean (Značit će -> Značiće)
-    'značit ću': 'značiću',
-    'značit ćeš': 'značićeš',
-    'značit će': 'značiće',
-    'značit ćemo': 'značićemo',
-    'značit ćete': 'značićete',
-    
-    # Lower (Spustit ću -> Spustiću)
-    'spustit ću': 'spustiću',
-    'Spustit ću': 'Spustiću',
-    'spustit ćeš': 'spustićeš',
-    'spustit će': 'spustiće',
-    'spustit ćemo': 'spustićemo',
-    'spustit ćete': 'spustićete',
-    
-    # Scream (Vrištat će -> Vristaće)
-    'vrištat ću': 'vrištaću',
-    'vrištat ćeš': 'vrištaćeš',
-    'vrištat će': 'vrištaće',
-    'Vrištat će': 'Vrištaće',
-    'vrištat ćemo': 'vrištaćemo',
-    'vrištat ćete': 'vrištaćete',
-    
-    # Wander (Lutat ću -> Lutaću)
-    'lutat ću': 'lutaću',
-    'Lutat ću': 'Lutaću',
-    'lutat ćeš': 'lutaćeš',
-    'lutat će': 'lutaće',
-    'lutat ćemo': 'lutaćemo',
-    'lutat ćete': 'lutaćete',
-    
-    # Do/Make (Učinit ćemo -> Učinićemo)
-    'učinit ću': 'učiniću',
-    'Učinit ću': 'Učiniću',
-    'učinit ćeš': 'učinićeš',
-    'učinit će': 'učiniće',
-    'učinit ćemo': 'učinićemo',
-    'Učinit ćemo': 'Učinićemo',
-    'učinit ćete': 'učinićete',
-    
-    # Perform/Appear (Nastupit ćeš -> Nastupićeš)
-    'nastupit ću': 'nastupiću',
-    'nastupit ćeš': 'nastupićeš',
-    'Nastupit ćeš': 'Nastupićeš',
-    'nastupit će': 'nastupiće',
-    'nastupit ćemo': 'nastupićemo',
-    'nastupit ćete': 'nastupićete',
-    
-    # Hide (Sakriti se -> same, but future forms)
-    'sakrit ću': 'sakriću',
-    'sakrit ćeš': 'sakrićeš',
-    'sakrit će': 'sakriće',
-    'sakrit ćemo': 'sakrićemo',
-    'sakrit ćete': 'sakrićete',
-    
-    # =====================================================
-    # PRICE (cijena -> cena)
-    # =====================================================
-    'cijena': 'cena',
-    'cijenu': 'cenu',
-    'cijene': 'cene',
-    'cijenom': 'cenom',
-    'cijenama': 'cenama',
-    'cijeni': 'ceni',
-    'cijenjen': 'cenjen',
-    'cijenjena': 'cenjena',
-    'cijenjeno': 'cenjeno',
-    'Cijena': 'Cena',
-    'Cijenu': 'Cenu',
-    
-    # =====================================================
-    # LEFT (lijevo -> levo)
-    # =====================================================
-    'lijevo': 'levo',
-    'lijeva': 'leva',
-    'lijevi': 'levi',
-    'lijeve': 'leve',
-    'lijeva': 'leva',
-    'lijevog': 'levog',
-    'lijevoj': 'levoj',
-    'lijevom': 'levom',
-    'Lijevo': 'Levo',
-    'Lijeva': 'Leva',
-    
-    # =====================================================
-    # RIGHT (desno - same in both)
-    # =====================================================
-    
-    # =====================================================
-    # CHILD (dijete -> dete)
-    # =====================================================
-    'dijete': 'dete',
-    'djeteta': 'deteta',
-    'djetetu': 'detetu',
-    'djetetom': 'detetom',
-    'Dijete': 'Dete',
-    
-    # =====================================================
-    # ANIMAL/BEAST (zvijer -> zver)
-    # =====================================================
-    'zvijer': 'zver',
-    'zvijeri': 'zveri',
-    'zvijerima': 'zverima',
-    'Zvijer': 'Zver',
-    'Zvijeri': 'Zveri',
-    
-    # =====================================================
-    # STAR (zvijezda -> zvezda)
-    # =====================================================
-    'zvijezda': 'zvezda',
-    'zvijezde': 'zvezde',
-    'zvijezdu': 'zvezdu',
-    'zvijezdom': 'zvezdom',
-    'zvijezdama': 'zvezdama',
-    'Zvijezda': 'Zvezda',
-    'Zvijezde': 'Zvezde',
-    
-    # =====================================================
-    # FORWARD (naprijed -> napred)
-    # =====================================================
-    'naprijed': 'napred',
-    'Naprijed': 'Napred',
-    'unaprijed': 'unapred',
-    'Unaprijed': 'Unapred',
-    
-    # =====================================================
-    # VALUE/WORTH (vrijediti -> vredeti)
-    # =====================================================
-    'vrijedi': 'vredi',
-    'vrijede': 'vrede',
-    'vrijedim': 'vredim',
-    'vrijediš': 'vrediš',
-    'vrijedimo': 'vredimo',
-    'vrijedite': 'vredite',
-    'Vrijedi': 'Vredi',
-    'vrijednost': 'vrednost',
-    'vrijednosti': 'vrednosti',
-    'Vrijednost': 'Vrednost',
-    'vrijedan': 'vredan',
-    'vrijedna': 'vredna',
-    'vrijedno': 'vredno',
-    'vrijedni': 'vredni',
-    'Vrijedan': 'Vredan',
-    
-    # =====================================================
-    # UNDERSTAND (razumjeti -> razumeti)
-    # =====================================================
-    'razumije': 'razume',
-    'razumijem': 'razumem',
-    'razumiješ': 'razumeš',
-    'razumijemo': 'razumemo',
-    'razumijete': 'razumete',
-    'razumiju': 'razumeju',
-    'Razumije': 'Razume',
-    'Razumijem': 'Razumem',
-    'Razumiješ': 'Razumeš',
-    
-    # =====================================================
-    # HURT/INJURE (ozlijediti -> ozlediti)
-    # =====================================================
-    'ozlijediti': 'ozlediti',
-    'ozlijedio': 'ozledio',
-    'ozlijedila': 'ozledila',
-    'ozlijedili': 'ozledili',
-    'ozlijeđen': 'ozleđen',
-    'ozlijeđena': 'ozleđena',
-    'ozlijeđeno': 'ozleđeno',
-    'Ozlijediti': 'Ozlediti',
-    'Ozlijeđen': 'Ozleđen',
-    
-    # =====================================================
-    # SIN (grijeh -> greh)
-    # =====================================================
-    'grijeh': 'greh',
-    'grijeha': 'greha',
-    'grijehu': 'grehu',
-    'grijehom': 'grehom',
-    'Grijeh': 'Greh',
-    'griješiti': 'grešiti',
-    'griješim': 'grešim',
-    'griješiš': 'grešiš',
-    'griješi': 'greši',
-    'griješimo': 'grešimo',
-    'griješite': 'grešite',
-    'griješe': 'greše',
-    'Griješiti': 'Grešiti',
-    
-    # =====================================================
-    # SOLVE/RESOLVE (riješiti -> rešiti)
-    # =====================================================
-    'riješiti': 'rešiti',
-    'riješio': 'rešio',
-    'riješila': 'rešila',
-    'riješili': 'rešili',
-    'riješeno': 'rešeno',
-    'Riješiti': 'Rešiti',
-    'Riješeno': 'Rešeno',
-    
-    # =====================================================
-    # MAKE MISTAKE (pogriješiti -> pogrešiti)
-    # =====================================================
-    'pogriješiti': 'pogrešiti',
-    'pogriješio': 'pogrešio',
-    'pogriješila': 'pogrešila',
-    'pogriješili': 'pogrešili',
-    'Pogriješiti': 'Pogrešiti',
-    'Pogriješio': 'Pogrešio',
-    
-    # =====================================================
-    # WHOLE/ENTIRE (cijeli -> celi)
-    # =====================================================
-    'cijeli': 'celi',
-    'cijela': 'cela',
-    'cijelo': 'celo',
-    'cijele': 'cele',
-    'cijelog': 'celog',
-    'cijeloj': 'celoj',
-    'cijelom': 'celom',
-    'cijelih': 'celih',
-    'Cijeli': 'Celi',
-    'Cijela': 'Cela',
-    'Cijelo': 'Celo',
-    'Cijele': 'Cele',
-    
-    # =====================================================
-    # HURT/INJURED (povrijediti -> povrediti)
-    # =====================================================
-    'povrijediti': 'povrediti',
-    'povrijedio': 'povredio',
-    'povrijedila': 'povredila',
-    'povrijedili': 'povredili',
-    'povrijeđen': 'povređen',
-    'povrijeđena': 'povređena',
-    'povrijeđeno': 'povređeno',
-    'povrijeđeni': 'povređeni',
-    'povrijeđene': 'povređene',
-    'Povrijediti': 'Povrediti',
-    'Povrijeđen': 'Povređen',
-    'Povrijeđena': 'Povređena',
-    
-    # =====================================================
-    # DIVISION/SHARE (podjela -> podela)
-    # =====================================================
-    'podjela': 'podela',
-    'podjele': 'podele',
-    'podjeli': 'podeli',
-    'podjelom': 'podelom',
-    'podjelu': 'podelu',
-    'Podjela': 'Podela',
-    'Podjele': 'Podele',
-    'Podjelu': 'Podelu',
-    'podjeliti': 'podeliti',
-    'podijeliti': 'podeliti',
-    'podijelio': 'podelio',
-    'podijelila': 'podelila',
-    'podijelili': 'podelili',
-    'podijele': 'podele',
-    'podijeli': 'podeli',
-    'Podijeliti': 'Podeliti',
-    'Podijeli': 'Podeli',
-    
-    # =====================================================
-    # PASS/CROSS (prijeći -> preći)
-    # =====================================================
-    'prijeći': 'preći',
-    'prešao': 'prešao',
-    'prešla': 'prešla',
-    'prešli': 'prešli',
-    'prijelaz': 'prelaz',
-    'prijelaza': 'prelaza',
-    'prijelazu': 'prelazu',
-    'Prijelaz': 'Prelaz',
-    'prijedlog': 'predlog',
-    'prijedloga': 'predloga',
-    'prijedlogu': 'predlogu',
-    'Prijedlog': 'Predlog',
-    
-    # =====================================================
-    # PERSON WORDS (čovjek, ljudi)
-    # =====================================================
-    'čovjek': 'čovek',
-    'čovjeka': 'čoveka',
-    'čovjeku': 'čoveku',
-    'čovjekom': 'čovekom',
-    'čovječe': 'čoveče',
-    'Čovjek': 'Čovek',
-    'Čovjeka': 'Čoveka',
-    'Čovjeku': 'Čoveku',
-    'čovječanstvo': 'čovečanstvo',
-    'čovječanstva': 'čovečanstva',
-    'Čovječanstvo': 'Čovečanstvo',
-    
-    # GUYS/BOYS (dečki -> momci)
-    'dečki': 'momci',
-    'dečko': 'momak',
-    'dečka': 'momka',
-    'dečku': 'momku',
-    'dečkom': 'momkom',
-    'Dečki': 'Momci',
-    'Dečko': 'Momak',
-    
-    # DOG/PUPPY (psić -> pas)
-    'psić': 'pas',
-    'psića': 'psa',
-    'psiću': 'psu',
-    'psićem': 'psom',
-    'psići': 'psi',
-    'Psić': 'Pas',
-    'Psići': 'Psi',
-    
-    # =====================================================
-    # ANGER/RAGE WORDS (bijes -> bes)
-    # =====================================================
-    'bijes': 'bes',
-    'bijesa': 'besa',
-    'bijesu': 'besu',
-    'bijesom': 'besom',
-    'Bijes': 'Bes',
-    'bijesan': 'besan',
-    'bijesna': 'besna',
-    'bijesno': 'besno',
-    'bijesni': 'besni',
-    'bijesne': 'besne',
-    'bijesnu': 'besnu',
-    'bijesnog': 'besnog',
-    'bijesnoj': 'besnoj',
-    'bijesnom': 'besnom',
-    'Bijesan': 'Besan',
-    'Bijesna': 'Besna',
-    'Bijesno': 'Besno',
-    'Bijesni': 'Besni',
-    'Bijesne': 'Besne',
-    'Bijesnom': 'Besnom',
-    
-    # =====================================================
-    # SUCCESS/FAILURE WORDS
-    # =====================================================
-    'uspjeh': 'uspeh',
-    'uspjeha': 'uspeha',
-    'uspjehu': 'uspehu',
-    'uspjehom': 'uspehom',
-    'Uspjeh': 'Uspeh',
-    'uspješan': 'uspešan',
-    'uspješna': 'uspešna',
-    'uspješno': 'uspešno',
-    'uspješni': 'uspešni',
-    'Uspješan': 'Uspešan',
-    'Uspješna': 'Uspešna',
-    'Uspješno': 'Uspešno',
-    'uspio': 'uspeo',
-    'uspjela': 'uspela',
-    'uspjeli': 'uspeli',
-    'uspjelo': 'uspelo',
-    'Uspio': 'Uspeo',
-    'Uspjela': 'Uspela',
-    'Uspjeli': 'Uspeli',
-    'neuspjeh': 'neuspeh',
-    'neuspjeha': 'neuspeha',
-    'Neuspjeh': 'Neuspeh',
-    # Infinitive forms
-    'uspjeti': 'uspeti',
-    'Uspjeti': 'Uspeti',
-    
-    # =====================================================
-    # DOWN (dolje -> dole)
-    # =====================================================
-    'dolje': 'dole',
-    'Dolje': 'Dole',
-    'odozdo': 'odozdo',
-    'podalje': 'podalje',
-    
-    # =====================================================
-    # KNEE (koljeno -> koleno)
-    # =====================================================
-    'koljeno': 'koleno',
-    'koljena': 'kolena',
-    'koljenu': 'kolenu',
-    'koljenom': 'kolenom',
-    'koljenima': 'kolenima',
-    'Koljeno': 'Koleno',
-    'Koljena': 'Kolena',
-    
-    # =====================================================
-    # FORCE/DRIVE (natjerati -> naterati)
-    # =====================================================
-    'natjerati': 'naterati',
-    'natjerao': 'naterao',
-    'natjerala': 'naterala',
-    'natjerali': 'naterali',
-    'natjera': 'natera',
-    'Natjerati': 'Naterati',
-    'Natjerao': 'Naterao',
-    'tjerati': 'terati',
-    'tjera': 'tera',
-    'tjerao': 'terao',
-    'tjerala': 'terala',
-    'tjerali': 'terali',
-    'Tjerati': 'Terati',
-    'istjerati': 'isterati',
-    'istjerao': 'isterao',
-    'istjerala': 'isterala',
-    'istjerali': 'isterali',
-    'potjerati': 'poterati',
-    'potjerao': 'poterao',
-    'potjerala': 'poterala',
-    'potjerali': 'poterali',
-    'protjerati': 'proterati',
-    'protjerao': 'proterao',
-    'protjerala': 'proterala',
-    'protjerali': 'proterali',
-    
-    # =====================================================
-    # WHITE/BRIGHT WORDS (bijel -> bel)
-    # =====================================================
-    'bijel': 'beo',
-    'bijela': 'bela',
-    'bijelo': 'belo',
-    'bijeli': 'beli',
-    'bijele': 'bele',
-    'bijelom': 'belom',
-    'bijeloj': 'beloj',
-    'bijelih': 'belih',
-    'Bijel': 'Beo',
-    'Bijela': 'Bela',
-    'Bijelo': 'Belo',
-    'Bijeli': 'Beli',
-    
-    # =====================================================
-    # LAUGHTER WORDS (smijeh -> smeh)
-    # =====================================================
-    'smijeh': 'smeh',
-    'smijeha': 'smeha',
-    'smijehu': 'smehu',
-    'smijehom': 'smehom',
-    'Smijeh': 'Smeh',
-    'smiješan': 'smešan',
-    'smiješna': 'smešna',
-    'smiješno': 'smešno',
-    'smiješni': 'smešni',
-    'smiješne': 'smešne',
-    'Smiješan': 'Smešan',
-    'Smiješna': 'Smešna',
-    'Smiješno': 'Smešno',
-    'smijati': 'smejati',
-    'smijem': 'smejem',
-    'smiješ': 'smeješ',
-    
-    # =====================================================
-    # NEXT/FOLLOWING (sljedeći -> sledeći)
-    # =====================================================
-    'sljedeći': 'sledeći',
-    'sljedeća': 'sledeća',
-    'sljedeće': 'sledeće',
-    'sljedećeg': 'sledećeg',
-    'sljedećoj': 'sledećoj',
-    'sljedećem': 'sledećem',
-    'Sljedeći': 'Sledeći',
-    'Sljedeća': 'Sledeća',
-    'Sljedeće': 'Sledeće',
-    
-    # =====================================================
-    # WINNER/VICTORY (pobjednik -> pobednik)
-    # =====================================================
-    'pobjednik': 'pobednik',
-    'pobjednika': 'pobednika',
-    'pobjedniku': 'pobedniku',
-    'pobjednikom': 'pobednikom',
-    'pobjednici': 'pobednici',
-    'Pobjednik': 'Pobednik',
-    'pobjeda': 'pobeda',
-    'pobjede': 'pobede',
-    'pobjedu': 'pobedu',
-    'pobjedom': 'pobedom',
-    'Pobjeda': 'Pobeda',
-    'pobijediti': 'pobediti',
-    'pobijedio': 'pobedio',
-    'pobijedila': 'pobedila',
-    'pobijedili': 'pobedili',
-    
-    # =====================================================
-    # ESCAPE (pobjeći -> pobeći)
-    # =====================================================
-    'pobjeći': 'pobeći',
-    'pobjegao': 'pobegao',
-    'pobjegla': 'pobegla',
-    'pobjegli': 'pobegli',
-    'Pobjeći': 'Pobeći',
-    'bježati': 'bežati',
-    'bježim': 'bežim',
-    'bježiš': 'bežiš',
-    'bježi': 'beži',
-    'bježimo': 'bežimo',
-    'bježite': 'bežite',
-    'bježe': 'beže',
-    'Bježati': 'Bežati',
-    'Bježi': 'Beži',
-    'Bježite': 'Bežite',
-    'Bježimo': 'Bežimo',
-    
-    # =====================================================
-    # AVOID (izbjegavati -> izbegavati)
-    # =====================================================
-    'izbjegavati': 'izbegavati',
-    'izbjegavam': 'izbegavam',
-    'izbjegavaš': 'izbegavaš',
-    'izbjegava': 'izbegava',
-    'izbjegavamo': 'izbegavamo',
-    'izbjegavate': 'izbegavate',
-    'izbjegavaju': 'izbegavaju',
-    'izbjegavaj': 'izbegavaj',
-    'izbjegavajte': 'izbegavajte',
-    'Izbjegavati': 'Izbegavati',
-    'Izbjegavajte': 'Izbegavajte',
-    'izbjegao': 'izbegao',
-    'izbjegla': 'izbegla',
-    'izbjegli': 'izbegli',
-    
-    # =====================================================
-    # DIE/DEATH (umrijeti -> umreti)
-    # =====================================================
-    'umrijeti': 'umreti',
-    'umro': 'umro',
-    'umrla': 'umrla',
-    'umrli': 'umrli',
-    'Umrijeti': 'Umreti',
-    'smrt': 'smrt',
-    'smrti': 'smrti',
-    
-    # =====================================================
-    # WORLD (svijet -> svet) - expanded
-    # =====================================================
-    'svijet': 'svet',
-    'svijeta': 'sveta',
-    'svijetu': 'svetu',
-    'svjetom': 'svetom',
-    'Svijet': 'Svet',
-    'svjetski': 'svetski',
-    'svjetska': 'svetska',
-    'svjetsko': 'svetsko',
-    'svjetske': 'svetske',
-    'svjetskog': 'svetskog',
-    'svjetskoj': 'svetskoj',
-    'Svjetski': 'Svetski',
-    'Svjetska': 'Svetska',
-    'Svjetsko': 'Svetsko',
-    'Svjetske': 'Svetske',
-    
-    # =====================================================
-    # LIFELONG (cjeloživotni -> celoživotni)
-    # =====================================================
-    'cjeloživotna': 'celoživotna',
-    'cjeloživotni': 'celoživotni',
-    'cjeloživotno': 'celoživotno',
-    'Cjeloživotna': 'Celoživotna',
-    'Cjeloživotni': 'Celoživotni',
-    'cjelokupan': 'celokupan',
-    'cjelokupna': 'celokupna',
-    'cjelokupno': 'celokupno',
-    'Cjelokupan': 'Celokupan',
-    
-    # =====================================================
-    # FAULT/GUILT (krivica)
-    # =====================================================
-    'krivica': 'krivica',
-    'krivnja': 'krivica',
-    'krivnje': 'krivice',
-    
-    # =====================================================
-    # EXPLODE
-    # =====================================================
-    'eksplodirat': 'eksplodiraće',
-    'eksplodirati': 'eksplodirati',
-    
-    # =====================================================
-    # LIKE/PLEASE (svidjeti -> svideti)
-    # =====================================================
-    'svidjeti': 'svideti',
-    'svidio': 'svideo',
-    'svidjela': 'svidela',
-    'svidjeli': 'svideli',
-    'svidjelo': 'svidelo',
-    'svidje': 'svide',
-    'sviđa': 'sviđa',
-    
-    # =====================================================
-    # NOTICE/PERCEIVE (primijetiti -> primetiti)
-    # =====================================================
-    'primijetiti': 'primetiti',
-    'primijetio': 'primetio',
-    'primijetila': 'primetila',
-    'primijetili': 'primetili',
-    'primijete': 'primete',
-    'primijeti': 'primeti',
-    'Primijetiti': 'Primetiti',
-    
-    # =====================================================
-    # CAPITAL (prijestolnica -> prestonica)
-    # =====================================================
-    'prijestolnica': 'prestonica',
-    'prijestolnice': 'prestonice',
-    'prijestolnici': 'prestonici',
-    'Prijestolnica': 'Prestonica',
-    
-    # =====================================================
-    # BODY (tijelo -> telo)
-    # =====================================================
-    'tijelo': 'telo',
-    'tijela': 'tela',
-    'tijelu': 'telu',
-    'tijelom': 'telom',
-    'Tijelo': 'Telo',
-    'tjelesni': 'telesni',
-    'tjelesna': 'telesna',
-    'tjelesno': 'telesno',
-    
-    # =====================================================
-    # FLOW/COURSE (tijek -> tok)
-    # =====================================================
-    'tijek': 'tok',
-    'tijeka': 'toka',
-    'tijeku': 'toku',
-    'tijekom': 'tokom',
-    'Tijek': 'Tok',
-    'Tijekom': 'Tokom',
-    
-    # =====================================================
-    # PANTS (hlače -> pantalone)
-    # =====================================================
-    'hlače': 'pantalone',
-    'hlača': 'pantalona',
-    'hlačama': 'pantalonama',
-    'Hlače': 'Pantalone',
-    
-    # =====================================================
-    # PLIERS/TONGS (kliješta -> klešta)
-    # =====================================================
-    'kliješta': 'klešta',
-    'Kliješta': 'Klešta',
-    
-    # =====================================================
-    # SYSTEM (sustav -> sistem)
-    # =====================================================
-    'sustav': 'sistem',
-    'sustava': 'sistema',
-    'sustavu': 'sistemu',
-    'sustavom': 'sistemom',
-    'sustavi': 'sistemi',
-    'Sustav': 'Sistem',
-    
-    # =====================================================
-    # FAIR (pošten -> pošten - same but pošteno context)
-    # =====================================================
-    'pošteno': 'fer',
-    'Pošteno': 'Fer',
-    
-    # =====================================================
-    # WANT/WISH verbs (htjeti -> hteti)
-    # =====================================================
-    'htjeti': 'hteti',
-    'htio': 'hteo',
-    'htjela': 'htela',
-    'htjeli': 'hteli',
-    'htjelo': 'htelo',
-    'Htjeti': 'Hteti',
-    'Htio': 'Hteo',
-    'Htjela': 'Htela',
-    'Htjeli': 'Hteli',
-    
-    # =====================================================
-    # YESTERDAY (jučer -> juče)
-    # =====================================================
-    'jučer': 'juče',
-    'Jučer': 'Juče',
-    
-    # =====================================================
-    # TOMORROW (sutra - same in both)
-    # =====================================================
-    
-    # =====================================================
-    # EVENING (večer -> veče)
-    # =====================================================
-    'večer': 'veče',
-    'večeri': 'večeri',
-    'Večer': 'Veče',
-    'Večeras': 'Večeras',
-    
-    # =====================================================
-    # SORRY/EXCUSE (oprostiti -> izviniti)
-    # =====================================================
-    'oprosti': 'izvini',
-    'oprostite': 'izvinite',
-    'Oprosti': 'Izvini',
-    'Oprostite': 'Izvinite',
-    
-    # =====================================================
-    # TRY (pokušati -> probati/pokušati)
-    # =====================================================
-    'pokušaj': 'pokušaj',
-    'pokušajte': 'pokušajte',
-    
-    # =====================================================
-    # SHOULD/NEED (trebati)
-    # =====================================================
-    'trebao': 'trebao',
-    'trebala': 'trebala',
-    'trebali': 'trebali',
-    
-    # =====================================================
-    # Common vocabulary differences
-    # =====================================================
-    'tisuća': 'hiljada',
-    'tisuće': 'hiljade',
-    'tisući': 'hiljadi',
-    'tisućama': 'hiljadama',
-    'Tisuća': 'Hiljada',
-    'Tisuće': 'Hiljade',
-    'Tisući': 'Hiljadi',
-    
-    'kruh': 'hleb',
-    'kruha': 'hleba',
-    'kruhu': 'hlebu',
-    'kruhom': 'hlebom',
-    'Kruh': 'Hleb',
-    
-    'tjedan': 'nedelja',
-    'tjedna': 'nedelje',
-    'tjednu': 'nedelji',
-    'tjednima': 'nedeljama',
-    'Tjedan': 'Nedelja',
-    
-    'zrak': 'vazduh',
-    'zraka': 'vazduha',
-    'zraku': 'vazduhu',
-    'zrakom': 'vazduhom',
-    'Zrak': 'Vazduh',
-    
-    'vlak': 'voz',
-    'vlaka': 'voza',
-    'vlaku': 'vozu',
-    'vlakom': 'vozom',
-    'vlakovi': 'vozovi',
-    'vlakova': 'vozova',
-    'Vlak': 'Voz',
-    
-    'kolodvor': 'stanica',
-    'kolodvora': 'stanice',
-    'kolodvoru': 'stanici',
-    'kolodvorom': 'stanicom',
-    'Kolodvor': 'Stanica',
-    
-    'kazalište': 'pozorište',
-    'kazališta': 'pozorišta',
-    'kazalištu': 'pozorištu',
-    'kazalištem': 'pozorištem',
-    'Kazalište': 'Pozorište',
-    
-    'sveučilište': 'univerzitet',
-    'sveučilišta': 'univerziteta',
-    'sveučilištu': 'univerzitetu',
-    'sveučilištem': 'univerzitetom',
-    'Sveučilište': 'Univerzitet',
-    
-    'glazba': 'muzika',
-    'glazbe': 'muzike',
-    'glazbi': 'muzici',
-    'glazbom': 'muzikom',
-    'glazbeni': 'muzički',
-    'glazbena': 'muzička',
-    'glazbeno': 'muzičko',
-    'Glazba': 'Muzika',
-    
-    'otok': 'ostrvo',
-    'otoka': 'ostrva',
-    'otoku': 'ostrvu',
-    'otokom': 'ostrvom',
-    'otoci': 'ostrva',
-    'Otok': 'Ostrvo',
-    
-    'tvrtka': 'firma',
-    'tvrtke': 'firme',
-    'tvrtki': 'firmi',
-    'tvrtkom': 'firmom',
-    'Tvrtka': 'Firma',
-    
-    'udruga': 'udruženje',
-    'udruge': 'udruženja',
-    'udruzi': 'udruženju',
-    'udrugom': 'udruženjem',
-    'Udruga': 'Udruženje',
-    
-    'opća': 'opšta',
-    'opći': 'opšti',
-    'opće': 'opšte',
-    'općeg': 'opšteg',
-    'općoj': 'opštoj',
-    'općim': 'opštim',
-    'općenito': 'uopšte',
-    'Opća': 'Opšta',
-    'Opći': 'Opšti',
-    'Opće': 'Opšte',
-    
-    'osobito': 'naročito',
-    'Osobito': 'Naročito',
-    
-    'točno': 'tačno',
-    'točan': 'tačan',
-    'točna': 'tačna',
-    'točke': 'tačke',
-    'točku': 'tačku',
-    'točka': 'tačka',
-    'Točno': 'Tačno',
-    'Točka': 'Tačka',
-    
-    'tečaj': 'kurs',
-    'tečaja': 'kursa',
-    'tečaju': 'kursu',
-    'tečajem': 'kursom',
-    'Tečaj': 'Kurs',
-    
-    'uspjeh': 'uspeh',
-    'uspjeha': 'uspeha',
-    'uspjehu': 'uspehu',
-    'uspjehom': 'uspehom',
-    'uspješan': 'uspešan',
-    'uspješna': 'uspešna',
-    'uspješno': 'uspešno',
-    'Uspjeh': 'Uspeh',
-    'Uspješan': 'Uspešan',
-    
-    'pogreška': 'greška',
-    'pogreške': 'greške',
-    'pogrešku': 'grešku',
-    'pogreškom': 'greškom',
-    'Pogreška': 'Greška',
-    
-    'mjera': 'mera',
-    'mjere': 'mere',
-    'mjeri': 'meri',
-    'mjerom': 'merom',
-    'Mjera': 'Mera',
-    
-    'mjeren': 'meren',
-    'mjerenje': 'merenje',
-    'mjerenja': 'merenja',
-    'mjeriti': 'meriti',
-    
-    'mjesto': 'mesto',
-    'mjesta': 'mesta',
-    'mjestu': 'mestu',
-    'mjestom': 'mestom',
-    'Mjesto': 'Mesto',
-    
-    'mjesec': 'mesec',
-    'mjeseca': 'meseca',
-    'mjesecu': 'mesecu',
-    'mjesecom': 'mesecom',
-    'mjeseci': 'meseci',
-    'Mjesec': 'Mesec',
-    
-    'sjeme': 'seme',
-    'sjemena': 'semena',
-    'sjemenu': 'semenu',
-    'Sjeme': 'Seme',
-    
-    'sjever': 'sever',
-    'sjevera': 'severa',
-    'sjeveru': 'severu',
-    'sjeverni': 'severni',
-    'sjeverna': 'severna',
-    'sjeverno': 'severno',
-    'Sjever': 'Sever',
-    
-    'vrijeme': 'vreme',
-    'vremena': 'vremena',
-    'vremenu': 'vremenu',
-    'Vrijeme': 'Vreme',
-    
-    'riječ': 'reč',
-    'riječi': 'reči',
-    'riječima': 'rečima',
-    'riječju': 'rečju',
-    'Riječ': 'Reč',
-    
-    'rječnik': 'rečnik',
-    'rječnika': 'rečnika',
-    'rječniku': 'rečniku',
-    'Rječnik': 'Rečnik',
-    
-    'rijeka': 'reka',
-    'rijeke': 'reke',
-    'rijeci': 'reci',
-    'rijekom': 'rekom',
-    'Rijeka': 'Reka',
-    
-    'liječnik': 'lekar',
-    'liječnika': 'lekara',
-    'liječniku': 'lekaru',
-    'liječnici': 'lekari',
-    'Liječnik': 'Lekar',
-    
-    'liječenje': 'lečenje',
-    'liječenja': 'lečenja',
-    'liječiti': 'lečiti',
-    'Liječenje': 'Lečenje',
-    
-    'lijek': 'lek',
-    'lijeka': 'leka',
-    'lijeku': 'leku',
-    'lijekom': 'lekom',
-    'lijekovi': 'lekovi',
-    'Lijek': 'Lek',
-    
-    'lijepa': 'lepa',
-    'lijep': 'lep',
-    'lijepo': 'lepo',
-    'lijepog': 'lepog',
-    'lijepoj': 'lepoj',
-    'Lijep': 'Lep',
-    'Lijepa': 'Lepa',
-    'Lijepo': 'Lepo',
-    
-    'mlijeko': 'mleko',
-    'mlijeka': 'mleka',
-    'mlijeku': 'mleku',
-    'Mlijeko': 'Mleko',
-    
-    'cvijet': 'cvet',
-    'cvijeta': 'cveta',
-    'cvijetu': 'cvetu',
-    'cvijeće': 'cveće',
-    'cvijećem': 'cvećem',
-    'Cvijet': 'Cvet',
-    'Cvijeće': 'Cveće',
-    
-    'svijet': 'svet',
-    'svijeta': 'sveta',
-    'svijetu': 'svetu',
-    'Svijet': 'Svet',
-    
-    'svjetlo': 'svetlo',
-    'svjetla': 'svetla',
-    'svjetlu': 'svetlu',
-    'Svjetlo': 'Svetlo',
-    
-    'djeca': 'deca',
-    'djece': 'dece',
-    'djeci': 'deci',
-    'djecom': 'decom',
-    'djecu': 'decu',
-    'Djeca': 'Deca',
-    'Djecu': 'Decu',
-    
-    'dječak': 'dečak',
-    'dječaka': 'dečaka',
-    'dječaku': 'dečaku',
-    'dječaci': 'dečaci',
-    'Dječak': 'Dečak',
-    
-    'djevojka': 'devojka',
-    'djevojke': 'devojke',
-    'djevojci': 'devojci',
-    'djevojkom': 'devojkom',
-    'Djevojka': 'Devojka',
-    
-    'djed': 'deda',
-    'djeda': 'dede',
-    'djedu': 'dedi',
-    'djedom': 'dedom',
-    'Djed': 'Deda',
-    
-    'djelovati': 'delovati',
-    'djeluje': 'deluje',
-    'djelujem': 'delujem',
-    'djelovanje': 'delovanje',
-    
-    'povijest': 'istorija',
-    'povijesti': 'istorije',
-    'poviješću': 'istorijom',
-    'povijesni': 'istorijski',
-    'povijesna': 'istorijska',
-    'povijesno': 'istorijsko',
-    'povijesnim': 'istorijskim',
-    'povijesnih': 'istorijskih',
-    'povijesne': 'istorijske',
-    'Povijest': 'Istorija',
-    'Povijesni': 'Istorijski',
-    
-    'odgoj': 'vaspitanje',
-    'odgoja': 'vaspitanja',
-    'odgoju': 'vaspitanju',
-    'odgojiti': 'vaspitati',
-    'Odgoj': 'Vaspitanje',
-    
-    'promicati': 'promovisati',
-    'promiče': 'promoviše',
-    
-    'tražilica': 'pretraživač',
-    'tražilice': 'pretraživača',
-    'tražilici': 'pretraživaču',
-    'Tražilica': 'Pretraživač',
-    
-    'računalo': 'računar',
-    'računala': 'računara',
-    'računalu': 'računaru',
-    'računalom': 'računarom',
-    'Računalo': 'Računar',
-    
-    'tipkovnica': 'tastatura',
-    'tipkovnice': 'tastature',
-    'tipkovnici': 'tastaturi',
-    'tipkovnicom': 'tastaturom',
-    'Tipkovnica': 'Tastatura',
-    
-    'zaslon': 'ekran',
-    'zaslona': 'ekrana',
-    'zaslonu': 'ekranu',
-    'zaslonom': 'ekranom',
-    'Zaslon': 'Ekran',
-    
-    'datoteka': 'fajl',
-    'datoteke': 'fajla',
-    'datoteci': 'fajlu',
-    'datotekom': 'fajlom',
-    'Datoteka': 'Fajl',
-    
-    'mapa': 'folder',
-    'mape': 'foldera',
-    'mapi': 'folderu',
-    'mapom': 'folderom',
-    
-    'pričekaj': 'sačekaj',
-    'pričekajte': 'sačekajte',
-    'Pričekaj': 'Sačekaj',
-    'Pričekajte': 'Sačekajte',
-    
-    'odabrati': 'izabrati',
-    'odabir': 'izbor',
-    'odabira': 'izbora',
-    'odabiru': 'izboru',
-    'Odabrati': 'Izabrati',
-    'Odabir': 'Izbor',
-    
-    'cesta': 'put',
-    'ceste': 'puta',
-    'cesti': 'putu',
-    'cestom': 'putem',
-    'Cesta': 'Put',
-    
-    'sat': 'čas',
-    'sata': 'časa',
-    'satu': 'času',
-    'satom': 'časom',
-    'sati': 'časova',
-    'satima': 'časovima',
-    
-    'šalica': 'šolja',
-    'šalice': 'šolje',
-    'šalici': 'šolji',
-    'šalicom': 'šoljom',
-    'Šalica': 'Šolja',
-    
-    'žlica': 'kašika',
-    'žlice': 'kašike',
-    'žlici': 'kašici',
-    'žlicom': 'kašikom',
-    'Žlica': 'Kašika',
-    
-    'zrcalo': 'ogledalo',
-    'zrcala': 'ogledala',
-    'zrcalu': 'ogledalu',
-    'zrcalom': 'ogledalom',
-    'Zrcalo': 'Ogledalo',
-    
-    'tvornica': 'fabrika',
-    'tvornice': 'fabrike',
-    'tvornici': 'fabrici',
-    'tvornicom': 'fabrikom',
-    'Tvornica': 'Fabrika',
-    
-    'poduzeće': 'preduzeće',
-    'poduzeća': 'preduzeća',
-    'poduzeću': 'preduzeću',
-    'poduzećem': 'preduzećem',
-    'Poduzeće': 'Preduzeće',
-    
-    'športski': 'sportski',
-    'šport': 'sport',
-    'športa': 'sporta',
-    'športu': 'sportu',
-    'Šport': 'Sport',
-    
-    'nutarnji': 'unutrašnji',
-    'nutarnja': 'unutrašnja',
-    'nutarnje': 'unutrašnje',
-    
-    'izvanjski': 'spoljašnji',
-    'izvanjska': 'spoljašnja',
-    'izvanjsko': 'spoljašnje',
-    
-    'prošle': 'prošle',
-    
-    'pisati ću': 'pisaću',
-    'raditi ću': 'radiću',
-    'doći ću': 'doći ću',
-    
-    'trebao bih': 'trebalo bi',
-    
-    # Question words
-    'što': 'šta',
-    'Što': 'Šta',
-    
-    'tko': 'ko',
-    'Tko': 'Ko',
-    
-    'netko': 'neko',
-    'Netko': 'Neko',
-    
-    'nitko': 'niko',
-    'Nitko': 'Niko',
-    
-    'svatko': 'svako',
-    'Svatko': 'Svako',
-    
-    'itko': 'iko',
-    'Itko': 'Iko',
-    
-    # Conjunctions and particles
-    'također': 'takođe',
-    'Također': 'Takođe',
-    
-    'uopće': 'uopšte',
-    'Uopće': 'Uopšte',
-    
-    'inače': 'inače',
-    
-    'jako': 'jako',
-    
-    'možda': 'možda',
-    
-    # Verb forms
-    'htjeti': 'hteti',
-    'htio': 'hteo',
-    'htjela': 'htela',
-    'htjeli': 'hteli',
-    
-    'smjeti': 'smeti',
-    'smio': 'smeo',
-    'smjela': 'smela',
-    'smjeli': 'smeli',
-    
-    'vidjeti': 'videti',
-    'vidio': 'video',
-    'vidjela': 'videla',
-    'vidjeli': 'videli',
-    
-    'razumjeti': 'razumeti',
-    'razumio': 'razumeo',
-    'razumjela': 'razumela',
-    'razumjeli': 'razumeli',
-    
-    'željeti': 'želeti',
-    'želio': 'želeo',
-    'željela': 'želela',
-    'željeli': 'želeli',
-    
-    'letjeti': 'leteti',
-    'letio': 'leteo',
-    'letjela': 'letela',
-    'letjeli': 'leteli',
-    
-    'trčati': 'trčati',
-    
-    'voljeti': 'voleti',
-    'volio': 'voleo',
-    'voljela': 'volela',
-    'voljeli': 'voleli',
-    
-    'živjeti': 'živeti',
-    'živio': 'živeo',
-    'živjela': 'živela',
-    'živjeli': 'živeli',
-    
-    'sjediti': 'sedeti',
-    'sjedio': 'sedeo',
-    'sjedila': 'sedela',
-    'sjedili': 'sedeli',
-    'sjedi': 'sedi',
-    'sjedim': 'sedim',
-    'sjedala': 'sedala',
-    'sjedalo': 'sedalo',
-    'Sjedala': 'Sedala',
-    
-    'sjesti': 'sesti',
-    'sjeo': 'seo',
-    'sjela': 'sela',
-    'sjeli': 'seli',
-    
-    # BELIEVE (vjerovati -> verovati)
-    'vjerovati': 'verovati',
-    'vjerujem': 'verujem',
-    'vjeruješ': 'veruješ',
-    'vjeruje': 'veruje',
-    'vjerujemo': 'verujemo',
-    'vjerujete': 'verujete',
-    'vjeruju': 'veruju',
-    'vjerovao': 'verovao',
-    'vjerovala': 'verovala',
-    'vjerovali': 'verovali',
-    'Vjerovati': 'Verovati',
-    'Vjerujem': 'Verujem',
-    'Vjeruješ': 'Veruješ',
-    'Vjeruje': 'Veruje',
-    'nevjerica': 'neverica',
-    'nevjerice': 'neverice',
-    'nevjerici': 'neverici',
-    'povjerovao': 'poverovao',
-    'povjerovala': 'poverovala',
-    'povjerovali': 'poverovali',
-    'povjeren': 'poveren',
-    'povjerenje': 'poverenje',
-    'povjerenja': 'poverenja',
-    'Povjerenje': 'Poverenje',
-    
-    # CHECK/VERIFY (provjeriti -> proveriti)
-    'provjeriti': 'proveriti',
-    'provjerio': 'proverio',
-    'provjerila': 'proverila',
-    'provjerili': 'proverili',
-    'provjeri': 'proveri',
-    'provjerim': 'proverim',
-    'provjerava': 'proverava',
-    'provjeravati': 'proveravati',
-    'Provjeriti': 'Proveriti',
-    
-    # EXERCISE (vježbati -> vežbati)
-    'vježbati': 'vežbati',
-    'vježbam': 'vežbam',
-    'vježbaš': 'vežbaš',
-    'vježba': 'vežba',
-    'vježbamo': 'vežbamo',
-    'vježbate': 'vežbate',
-    'vježbaju': 'vežbaju',
-    'vježbaj': 'vežbaj',
-    'Vježbati': 'Vežbati',
-    'Vježba': 'Vežba',
-    
-    # ARTIST (umjetnik -> umetnik)
-    'umjetnik': 'umetnik',
-    'umjetnika': 'umetnika',
-    'umjetniku': 'umetniku',
-    'umjetnikom': 'umetnikom',
-    'umjetnici': 'umetnici',
-    'Umjetnik': 'Umetnik',
-    'Umjetnici': 'Umetnici',
-    'umjetnost': 'umetnost',
-    'umjetnosti': 'umetnosti',
-    'Umjetnost': 'Umetnost',
-    
-    # NOTICE (primijetiti -> primetiti) - additional forms
-    'neprimijećen': 'neprimećen',
-    'neprimijećena': 'neprimećena',
-    'neprimijećeno': 'neprimećeno',
-    'Neprimijećen': 'Neprimećen',
-    # Also handle variant without 'i' (neprimjećen)
-    'neprimjećen': 'neprimećen',
-    'neprimjećena': 'neprimećena',
-    'neprimjećeno': 'neprimećeno',
-    'Neprimjećen': 'Neprimećen',
-    
-    # WITNESS (svjedočiti -> svedočiti)
-    'svjedočiti': 'svedočiti',
-    'svjedočim': 'svedočim',
-    'svjedočiš': 'svedočiš',
-    'svjedoči': 'svedoči',
-    'svjedočimo': 'svedočimo',
-    'svjedočite': 'svedočite',
-    'svjedoče': 'svedoče',
-    'svjedočio': 'svedočio',
-    'svjedočila': 'svedočila',
-    'svjedočili': 'svedočili',
-    'Svjedočiti': 'Svedočiti',
-    'svjedočit': 'svedočit',
-    'svjedok': 'svedok',
-    'svjedoka': 'svedoka',
-    'svjedoku': 'svedoku',
-    'Svjedok': 'Svedok',
-    
-    # SENSITIVE (osjetljiv -> osetljiv)
-    'osjetljiv': 'osetljiv',
-    'osjetljiva': 'osetljiva',
-    'osjetljivo': 'osetljivo',
-    'osjetljivi': 'osetljivi',
-    'osjetljive': 'osetljive',
-    'osjetljivog': 'osetljivog',
-    'osjetljivoj': 'osetljivoj',
-    'osjetljivom': 'osetljivom',
-    'osjetljivim': 'osetljivim',
-    'osjetljivih': 'osetljivih',
-    'neosjetljiv': 'neosetljiv',
-    'neosjetljiva': 'neosetljiva',
-    'neosjetljivo': 'neosetljivo',
-    'neosjetljivi': 'neosetljivi',
-    'neosjetljivim': 'neosetljivim',
-    'Osjetljiv': 'Osetljiv',
-    
-    # NEIGHBOR (susjed -> komšija/sused)
-    'susjed': 'komšija',
-    'susjeda': 'komšije',
-    'susjedu': 'komšiji',
-    'susjedom': 'komšijom',
-    'susjedi': 'komšije',
-    'Susjed': 'Komšija',
-    'susjedstvo': 'komšiluk',
-    'susjedstva': 'komšiluka',
-    'Susjedstvo': 'Komšiluk',
-    
-    # REFRESH (osvježiti -> osvežiti)
-    'osvježiti': 'osvežiti',
-    'osvježio': 'osvežio',
-    'osvježila': 'osvežila',
-    'osvježili': 'osvežili',
-    'osvježi': 'osveži',
-    'osvježenje': 'osveženje',
-    'osvježenja': 'osveženja',
-    'osvježenju': 'osveženju',
-    'Osvježiti': 'Osvežiti',
-    'Osvježenje': 'Osveženje',
-    
-    # GIRL diminutive (djevojčica -> devojčica)
-    'djevojčica': 'devojčica',
-    'djevojčice': 'devojčice',
-    'djevojčici': 'devojčici',
-    'djevojčicom': 'devojčicom',
-    'djevojčicu': 'devojčicu',
-    'Djevojčica': 'Devojčica',
-    'Djevojčicu': 'Devojčicu',
-    
-    # More common words
-    'Europa': 'Evropa',
-    'Europe': 'Evrope',
-    'Europi': 'Evropi',
-    'Europom': 'Evropom',
-    'europski': 'evropski',
-    'europska': 'evropska',
-    'europsko': 'evropsko',
-    
-    'organizacija': 'organizacija',
-    
-    'odlično': 'odlično',
-    
-    'dobro': 'dobro',
-    
-    # Days of week - Croatian to Serbian
-    'ponedjeljak': 'ponedeljak',
-    'ponedjeljka': 'ponedeljka',
-    'ponedjeljku': 'ponedeljku',
-    'Ponedjeljak': 'Ponedeljak',
-    
-    'srijeda': 'sreda',
-    'srijede': 'srede',
-    'srijedu': 'sredu',
-    'srijedom': 'sredom',
-    'Srijeda': 'Sreda',
-    
-    # Months
-    'siječanj': 'januar',
-    'siječnja': 'januara',
-    'siječnju': 'januaru',
-    'Siječanj': 'Januar',
-    
-    'veljača': 'februar',
-    'veljače': 'februara',
-    'veljači': 'februaru',
-    'Veljača': 'Februar',
-    
-    'ožujak': 'mart',
-    'ožujka': 'marta',
-    'ožujku': 'martu',
-    'Ožujak': 'Mart',
-    
-    'travanj': 'april',
-    'travnja': 'aprila',
-    'travnju': 'aprilu',
-    'Travanj': 'April',
-    
-    'svibanj': 'maj',
-    'svibnja': 'maja',
-    'svibnju': 'maju',
-    'Svibanj': 'Maj',
-    
-    'lipanj': 'jun',
-    'lipnja': 'juna',
-    'lipnju': 'junu',
-    'Lipanj': 'Jun',
-    
-    'srpanj': 'jul',
-    'srpnja': 'jula',
-    'srpnju': 'julu',
-    'Srpanj': 'Jul',
-    
-    'kolovoz': 'avgust',
-    'kolovoza': 'avgusta',
-    'kolovozu': 'avgustu',
-    'Kolovoz': 'Avgust',
-    
-    'rujan': 'septembar',
-    'rujna': 'septembra',
-    'rujnu': 'septembru',
-    'Rujan': 'Septembar',
-    
-    'listopad': 'oktobar',
-    'listopada': 'oktobra',
-    'listopadu': 'oktobru',
-    'Listopad': 'Oktobar',
-    
-    'studeni': 'novembar',
-    'studenoga': 'novembra',
-    'studenom': 'novembru',
-    'Studeni': 'Novembar',
-    
-    'prosinac': 'decembar',
-    'prosinca': 'decembra',
-    'prosincu': 'decembru',
-    'Prosinac': 'Decembar',
-}
+from subtitle_io import (NO_STATS, Engine, Stats, StatsReport, convert_srt_text, decode_bytes,
+                         detect_encoding, is_large_file, pool_map, print_result, run_pipeline,
+                         stream_convert)
+
+# Bump when the translation logic changes in a way that alters the output
+# or the counts stored with it, so cached translations from an older
+# version are not reused
+TRANSLATOR_VERSION = 5
+
+# Default size limit of the translation cache (--cache-size, in MB)
+DEFAULT_CACHE_MB = 512
+
+# Built matchers are saved here and reused while the dictionary is unchanged.
+# CYRILLIO_CACHE_DIR overrides the location; set it empty to disable.
+MATCHER_CACHE_ENV = 'CYRILLIO_CACHE_DIR'
+
+# Saved matchers not used for this many days are removed. The cache is
+# shared, so matchers of other dictionaries (another checkout or version)
+# are kept while they are in use.
+MATCHER_CACHE_MAX_AGE_DAYS = 30
+
+# Croatian to Serbian word mappings, in lowercase, kept in a compact
+# lexicon file next to this script. Title case and UPPER CASE forms are
+# matched and replaced in the same casing (see fold_mapping); add a
+# differently cased entry only for an exception.
+LEXICON_PATH = Path(__file__).with_name('croatian_to_serbian.lex')
+
+# Compiled form of LEXICON_PATH written by --build-lexicon. It is used
+# instead of parsing the lexicon while it was built from the same file
+# and translator version.
+LEXICON_ARTIFACT_PATH = LEXICON_PATH.with_suffix('.bin')
+
+# Bump when the artifact layout changes; older artifacts are ignored.
+LEXICON_MAGIC = b'CYRLEX2\n'
+
+# An ending group in a lexicon entry: {a,b,c} or <paradigm>
+LEXICON_GROUP_RE = re.compile(r'\{([^{}]*)\}|<([^<>]+)>')
+
+
+def parse_lexicon(lines, source: str = '<lexicon>') -> dict:
+    """
+    Compile lexicon lines (see croatian_to_serbian.lex for the format)
+    into a dict of every form they describe, in order.
+    Raises ValueError naming the line for malformed entries.
+    """
+    paradigms = {}
+    mapping = {}
+
+    def expand(text, side, where):
+        groups = list(LEXICON_GROUP_RE.finditer(text))
+        if not groups:
+            return [text]
+        if len(groups) > 1:
+            raise ValueError(f"{where}: more than one ending group in {text!r}")
+        group = groups[0]
+        if group.group(1) is not None:
+            endings = group.group(1).split(',')
+        elif group.group(2) in paradigms:
+            endings = paradigms[group.group(2)][side]
+        else:
+            raise ValueError(f"{where}: unknown paradigm <{group.group(2)}>")
+        head, tail = text[:group.start()], text[group.end():]
+        return [head + ending + tail for ending in endings]
+
+    for number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        where = f"{source}:{number}"
+        if line.startswith('paradigm '):
+            name, sep, endings = line[len('paradigm '):].partition(' = ')
+            keys, arrow, values = endings.partition(' -> ')
+            keys = keys.split(',')
+            values = values.split(',') if arrow else keys
+            if not sep or len(keys) != len(values):
+                raise ValueError(f"{where}: malformed paradigm: {line}")
+            paradigms[name.strip()] = (keys, values)
+            continue
+
+        key, sep, value = line.partition(' = ')
+        if not sep:
+            raise ValueError(f"{where}: expected 'croatian = serbian': {line}")
+        keys = expand(key, 0, where)
+        values = expand(value, 1, where)
+        if len(values) == 1:
+            values *= len(keys)
+        if len(keys) != len(values):
+            raise ValueError(f"{where}: {len(keys)} forms but {len(values)} replacements")
+        mapping.update(zip(keys, values))
+    return mapping
+
+
+def load_lexicon(lexicon_path: Path = LEXICON_PATH) -> dict:
+    """Read and compile a lexicon file."""
+    with open(lexicon_path, 'r', encoding='utf-8') as f:
+        return parse_lexicon(f, str(lexicon_path))
+
+
+def dictionary_fingerprint(mapping: dict) -> str:
+    """Hash of a dictionary and the translator version."""
+    payload = json.dumps([TRANSLATOR_VERSION, sorted(mapping.items())], ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def build_lexicon_artifact(lexicon_path: Path = LEXICON_PATH,
+                           artifact_path: Path = LEXICON_ARTIFACT_PATH) -> int:
+    """
+    Compile a lexicon file into the artifact read by load_dictionary: the
+    magic, then a marshalled tuple of the SHA-256 of the lexicon file, the
+    translator version, the dictionary fingerprint and the dictionary.
+    Returns the number of entries written.
+    """
+    with open(lexicon_path, 'rb') as f:
+        source = f.read()
+    mapping = parse_lexicon(source.decode('utf-8').splitlines(), str(lexicon_path))
+    state = (hashlib.sha256(source).digest(), TRANSLATOR_VERSION, dictionary_fingerprint(mapping), mapping)
+    artifact_path = Path(artifact_path)
+    tmp_path = artifact_path.with_name(f"{artifact_path.name}.tmp-{os.getpid()}")
+    with open(tmp_path, 'wb') as f:
+        f.write(LEXICON_MAGIC)
+        f.write(marshal.dumps(state))
+    os.replace(tmp_path, artifact_path)
+    return len(mapping)
+
+
+def read_lexicon_artifact(artifact_path: Path = LEXICON_ARTIFACT_PATH):
+    """
+    (digest, fingerprint, dictionary) from an artifact built by this
+    translator version, or None if it is missing, stale or unreadable.
+    """
+    try:
+        with open(artifact_path, 'rb') as f:
+            data = f.read()
+    except OSError:
+        return None
+    if not data.startswith(LEXICON_MAGIC):
+        return None
+    try:
+        digest, version, fingerprint, mapping = marshal.loads(data[len(LEXICON_MAGIC):])
+    except (EOFError, ValueError, TypeError):
+        return None
+    if version != TRANSLATOR_VERSION:
+        return None
+    return digest, fingerprint, mapping
+
+
+def load_dictionary(lexicon_path: Path = LEXICON_PATH,
+                    artifact_path: Path = LEXICON_ARTIFACT_PATH) -> tuple:
+    """
+    The compiled lexicon: the artifact if it was built from the current
+    lexicon file (or the lexicon file is not installed), else the lexicon
+    parsed again.
+
+    Returns:
+        Tuple of (dictionary, fingerprint); the fingerprint is None when
+        the lexicon was parsed, and computed on first use instead
+    """
+    try:
+        with open(lexicon_path, 'rb') as f:
+            source = f.read()
+    except FileNotFoundError:
+        source = None
+    artifact = read_lexicon_artifact(artifact_path)
+    if artifact is not None and (source is None or artifact[0] == hashlib.sha256(source).digest()):
+        return artifact[2], artifact[1]
+    if source is None:
+        raise FileNotFoundError(f"Lexicon not found: {lexicon_path}")
+    return parse_lexicon(source.decode('utf-8').splitlines(), str(lexicon_path)), None
+
+
+CROATIAN_TO_SERBIAN, _fingerprint = load_dictionary()
+
+def fold_case(text: str) -> str:
+    """
+    Lowercase text without changing its length, so positions found in the
+    result are positions in text (the few characters whose lowercase form
+    is longer, like 'İ', are kept as they are).
+    """
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    return ''.join(ch if len(ch.lower()) != 1 else ch.lower() for ch in text)
+
+
+def case_pattern(text: str) -> str:
+    """Return 'lower', 'title' or 'upper' for the casing of text, or None if mixed."""
+    lowered = text.lower()
+    if text == lowered:
+        return 'lower'
+    if text == text[:1].upper() + lowered[1:]:
+        return 'title'
+    if text == text.upper():
+        return 'upper'
+    return None
+
+
+def apply_case(text: str, pattern: str) -> str:
+    """Give text the casing pattern returned by case_pattern."""
+    if pattern == 'title':
+        return text[:1].upper() + text[1:]
+    if pattern == 'upper':
+        return text.upper()
+    return text
+
+
+def fold_mapping(mapping: dict) -> tuple:
+    """
+    Split a dictionary into lowercase keys and exact-case overrides.
+
+    Keys in Title case or UPPER case whose replacement is the lowercase
+    replacement in the same casing need no entry of their own. Any other
+    key is an override, used only where the text has exactly that casing.
+    A key that has no lowercase form in mapping gets one derived from it
+    when its replacement allows.
+
+    Returns:
+        Tuple of (words: dict, overrides: dict); words maps lowercase keys
+        to lowercase replacements
+    """
+    words = {}
+    overrides = {}
+    for key, value in mapping.items():
+        if case_pattern(key) == 'lower':
+            words[fold_case(key)] = value
+    for key, value in mapping.items():
+        pattern = case_pattern(key)
+        if pattern == 'lower':
+            continue
+        folded = fold_case(key)
+        if folded not in words and pattern and apply_case(value.lower(), pattern) == value:
+            words[folded] = value.lower()
+        elif folded not in words or apply_case(words[folded], pattern) != value:
+            overrides[key] = value
+    return words, overrides
+
 
 # Build regex pattern - sort by length descending to match longer words first
 # Use word boundaries to avoid partial matches
-def build_pattern():
-    """Build regex pattern with word boundaries."""
-    sorted_keys = sorted(CROATIAN_TO_SERBIAN.keys(), key=len, reverse=True)
+def build_pattern(mapping: dict = None):
+    """Build regex pattern with word boundaries over the lowercase keys."""
+    if mapping is None:
+        mapping = CROATIAN_TO_SERBIAN
+    words, overrides = fold_mapping(mapping)
+    keys = set(words) | {fold_case(key) for key in overrides}
+    sorted_keys = sorted(keys, key=len, reverse=True)
     escaped_keys = [re.escape(k) for k in sorted_keys]
     pattern = r'\b(' + '|'.join(escaped_keys) + r')\b'
     return re.compile(pattern)
 
-PATTERN = build_pattern()
 
+_pattern = None
+
+
+def get_pattern():
+    """Return the pattern for CROATIAN_TO_SERBIAN, compiled on first use."""
+    global _pattern
+    if _pattern is None:
+        _pattern = build_pattern()
+    return _pattern
+
+
+def __getattr__(name):
+    # PATTERN is compiled on first access, not at import time
+    if name == 'PATTERN':
+        return get_pattern()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def is_word_char(ch: str) -> bool:
+    """Return True if ch is a regex word character (\\w)."""
+    return ch.isalnum() or ch == '_'
+
+
+class Matcher:
+    """
+    Base class of the dictionary matchers.
+
+    Only the lowercase form of each key is indexed (see fold_mapping) and
+    text is matched case-insensitively. A match is replaced with the
+    override for its exact casing if there is one, else with the
+    lowercase replacement in the casing of the match (lower, Title or
+    UPPER); matches in any other casing are left as they are.
+    Subclasses implement find() on lowercased text.
+    """
+
+    name = None
+
+    def __init__(self, mapping: dict):
+        self.mapping = mapping
+        self.words, self.overrides = fold_mapping(mapping)
+
+    def keys(self) -> set:
+        """The lowercase keys to index."""
+        return set(self.words) | {fold_case(key) for key in self.overrides}
+
+    def terms(self) -> dict:
+        """Every key subn counts replacements under, with its replacement."""
+        return {**self.words, **self.overrides}
+
+    def replacement(self, source: str, key: str) -> str:
+        """Replacement for the matched source text, whose lowercase form is key."""
+        if source == key and key not in self.overrides:
+            return self.words.get(key, source)
+        value = self.overrides.get(source)
+        if value is not None:
+            return value
+        value = self.words.get(key)
+        pattern = case_pattern(source)
+        if value is None or pattern is None:
+            return source
+        return apply_case(value, pattern)
+
+    def find(self, lowered: str) -> list:
+        """Return the (start, end) spans of non-overlapping key matches."""
+        raise NotImplementedError
+
+    def sub(self, text: str) -> str:
+        """Replace every dictionary word in text."""
+        return self.subn(text)[0]
+
+    def subn(self, text: str, counts: dict = None) -> tuple:
+        """
+        Replace every dictionary word in text, like re.subn.
+        Returns (new_text, replacements); matches left unchanged (an
+        unsupported casing) are not counted. If counts is given, the
+        replacements are also added to it per dictionary key: the
+        lowercase key, or the override for an exceptionally cased one.
+        """
+        lowered = fold_case(text)
+        replacement = self.replacement
+        overrides = self.overrides
+        pieces = []
+        last_end = 0
+        for start, end in self.find(lowered):
+            source = text[start:end]
+            key = lowered[start:end]
+            value = replacement(source, key)
+            if value == source:
+                continue
+            pieces.append(text[last_end:start])
+            pieces.append(value)
+            last_end = end
+            if counts is not None:
+                if source in overrides:
+                    key = source
+                counts[key] = counts.get(key, 0) + 1
+        if not pieces:
+            return text, 0
+        replacements = len(pieces) // 2
+        pieces.append(text[last_end:])
+        return ''.join(pieces), replacements
+
+
+class RegexMatcher(Matcher):
+    """Dictionary matcher using a single word-bounded regex alternation."""
+
+    name = 'regex'
+
+    def __init__(self, mapping: dict):
+        super().__init__(mapping)
+        self.pattern = get_pattern() if mapping is CROATIAN_TO_SERBIAN else build_pattern(mapping)
+
+    def find(self, lowered: str) -> list:
+        """Return the (start, end) spans of non-overlapping key matches."""
+        return [m.span() for m in self.pattern.finditer(lowered)]
+
+
+class AhoCorasickMatcher(Matcher):
+    """
+    Dictionary matcher built on an Aho-Corasick automaton.
+
+    The text is scanned once regardless of the number of dictionary keys.
+    Matches are resolved exactly like the regex alternation: leftmost first,
+    longest key at each position, and only on word boundaries.
+    """
+
+    name = 'aho-corasick'
+
+    # Bump when the layout of state() changes
+    STATE_VERSION = 2
+
+    def __init__(self, mapping: dict):
+        super().__init__(mapping)
+
+        # Trie: goto[state] maps a character to the next state,
+        # lengths[state] lists the key lengths that end in that state
+        goto = [{}]
+        lengths = [()]
+        for key in self.keys():
+            state = 0
+            for ch in key:
+                next_state = goto[state].get(ch)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][ch] = next_state
+                    goto.append({})
+                    lengths.append(())
+                state = next_state
+            lengths[state] = (len(key),)
+
+        # Failure links (breadth first), merging the outputs of each
+        # state's longest proper suffix into its own
+        fail = [0] * len(goto)
+        queue = list(goto[0].values())
+        for state in queue:
+            for ch, next_state in goto[state].items():
+                queue.append(next_state)
+                suffix = fail[state]
+                while suffix and ch not in goto[suffix]:
+                    suffix = fail[suffix]
+                fail[next_state] = goto[suffix].get(ch, 0)
+                lengths[next_state] += lengths[fail[next_state]]
+
+        self.goto = goto
+        self.fail = fail
+        self.lengths = [tuple(sorted(found, reverse=True)) for found in lengths]
+        self.alphabet = frozenset(ch for key in self.keys() for ch in key)
+
+    def state(self) -> tuple:
+        """The built automaton as plain data, for saving with marshal."""
+        return (self.goto, self.fail, self.lengths, self.alphabet, self.words, self.overrides)
+
+    @classmethod
+    def from_state(cls, mapping: dict, state: tuple):
+        """Rebuild a matcher for mapping from state() without constructing it."""
+        matcher = cls.__new__(cls)
+        matcher.mapping = mapping
+        matcher.goto, matcher.fail, matcher.lengths, matcher.alphabet, matcher.words, matcher.overrides = state
+        return matcher
+
+    def find(self, lowered: str) -> list:
+        """Return the (start, end) spans of non-overlapping key matches."""
+        goto = self.goto
+        fail = self.fail
+        lengths = self.lengths
+        alphabet = self.alphabet
+        size = len(lowered)
+
+        def is_boundary(pos):
+            before = pos > 0 and is_word_char(lowered[pos - 1])
+            after = pos < size and is_word_char(lowered[pos])
+            return before != after
+
+        # Longest word-bounded key for every start position
+        best = {}
+        state = 0
+        for i, ch in enumerate(lowered):
+            if ch not in alphabet:
+                state = 0
+                continue
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if not lengths[state] or not is_boundary(i + 1):
+                continue
+            for length in lengths[state]:
+                start = i + 1 - length
+                if best.get(start, 0) < length and is_boundary(start):
+                    best[start] = length
+
+        # Leftmost-first, non-overlapping selection
+        spans = []
+        last_end = 0
+        for start in sorted(best):
+            if start >= last_end:
+                last_end = start + best[start]
+                spans.append((start, last_end))
+        return spans
+
+
+class TokenMatcher(Matcher):
+    """
+    Dictionary matcher using one tokenization pass and hash lookups.
 
-def croatian_to_serbian(text: str) -> str:
+    The text is split into alternating word and non-word runs, each word is
+    looked up in a dict, and the few multi-word keys ('bit ću') are found
+    through a secondary index keyed by their first word.
+    """
+
+    name = 'token'
+
+    # re.split with a capture group keeps the separators at odd indices
+    SPLITTER = re.compile(r'(\W+)')
+
+    def __init__(self, mapping: dict):
+        super().__init__(mapping)
+        self.single = set()
+        phrases = {}
+        for key in self.keys():
+            parts = self.SPLITTER.split(key)
+            if not parts[0] or not parts[-1]:
+                raise ValueError(f"Dictionary key must start and end with a word character: {key!r}")
+            if len(parts) == 1:
+                self.single.add(key)
+            else:
+                # (separators and words after the first word)
+                phrases.setdefault(parts[0], []).append(parts[1:])
+
+        # Longest phrase first, like the regex alternation
+        self.phrases = {
+            first: sorted(candidates, key=lambda rest: sum(map(len, rest)), reverse=True)
+            for first, candidates in phrases.items()
+        }
+
+    def find(self, lowered: str) -> list:
+        """Return the (start, end) spans of non-overlapping key matches."""
+        parts = self.SPLITTER.split(lowered)
+        tokens = parts[::2]
+        offsets = [0]
+        offsets.extend(accumulate(map(len, parts)))
+        single = self.single
+        spans = {k: (offsets[2 * k], offsets[2 * k + 1]) for k, token in enumerate(tokens) if token in single}
+
+        # Multi-word keys replace the single-word matches they span
+        phrases = self.phrases
+        consumed = 0
+        for k in [k for k, token in enumerate(tokens) if token in phrases]:
+            i = 2 * k
+            if i < consumed:
+                continue
+            for rest in phrases[tokens[k]]:
+                end = i + 1 + len(rest)
+                if parts[i + 1:end] == rest:
+                    for inner in range(k + 1, k + 1 + len(rest) // 2):
+                        spans.pop(inner, None)
+                    spans[k] = (offsets[i], offsets[end])
+                    consumed = end
+                    break
+
+        return [spans[k] for k in sorted(spans)]
+
+
+# Available matcher backends, selectable with --matcher
+MATCHERS = {
+    RegexMatcher.name: RegexMatcher,
+    AhoCorasickMatcher.name: AhoCorasickMatcher,
+    TokenMatcher.name: TokenMatcher,
+}
+DEFAULT_MATCHER = AhoCorasickMatcher.name
+
+_matcher_cache = {}
+
+
+def matcher_cache_dir() -> Path:
+    """Directory for saved matchers, or None if disabled."""
+    configured = os.environ.get(MATCHER_CACHE_ENV)
+    if configured is not None:
+        return Path(configured).expanduser() if configured else None
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join('~', '.cache')
+    return Path(base).expanduser() / 'cyrillio'
+
+
+def load_matcher(name: str):
+    """
+    Build the matcher for CROATIAN_TO_SERBIAN, or load it from the matcher
+    cache. Matchers with a state() (the Aho-Corasick automaton) are saved
+    with marshal under a name that includes the dictionary fingerprint, so
+    an edited dictionary is rebuilt and saved again. Regex patterns cannot
+    be saved compiled and are only built lazily.
+    """
+    cls = MATCHERS[name]
+    cache_dir = matcher_cache_dir()
+    if cache_dir is None or not hasattr(cls, 'from_state'):
+        return cls(CROATIAN_TO_SERBIAN)
+
+    prefix = f"{name}-v{cls.STATE_VERSION}-m{marshal.version}-"
+    path = cache_dir / f"{prefix}{mapping_fingerprint()[:32]}.bin"
+    try:
+        with open(path, 'rb') as f:
+            matcher = cls.from_state(CROATIAN_TO_SERBIAN, marshal.loads(f.read()))
+        try:
+            os.utime(path)  # mark as recently used
+        except OSError:
+            pass
+        return matcher
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+
+    matcher = cls(CROATIAN_TO_SERBIAN)
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.tmp-{os.getpid()}")
+        with open(tmp_path, 'wb') as f:
+            marshal.dump(matcher.state(), f)
+        os.replace(tmp_path, path)
+        # Drop matchers of the same layout that no dictionary used lately
+        cutoff = time.time() - MATCHER_CACHE_MAX_AGE_DAYS * 24 * 3600
+        for stale in cache_dir.glob(f"{prefix}*.bin"):
+            if stale != path and stale.stat().st_mtime < cutoff:
+                stale.unlink()
+    except OSError:
+        pass  # a read-only cache directory only costs the build time
+    return matcher
+
+
+def get_matcher(name: str = None):
+    """Return the (cached) matcher backend for CROATIAN_TO_SERBIAN."""
+    name = name or DEFAULT_MATCHER
+    if name not in _matcher_cache:
+        if name not in MATCHERS:
+            raise ValueError(f"Unknown matcher '{name}' (choose from: {', '.join(MATCHERS)})")
+        _matcher_cache[name] = load_matcher(name)
+    return _matcher_cache[name]
+
+
+def croatian_to_serbian(text: str, matcher: str = None) -> str:
     """Convert Croatian text to Serbian vocabulary."""
-    return PATTERN.sub(lambda m: CROATIAN_TO_SERBIAN[m.group()], text)
+    return get_matcher(matcher).sub(text)
 
 
-def detect_encoding(file_path: Path) -> str:
-    """Try to detect the file encoding."""
-    encodings = ['utf-8', 'utf-8-sig', 'cp1250', 'cp1251', 'iso-8859-2', 'iso-8859-1', 'latin-1']
-    
-    for encoding in encodings:
+def croatian_to_serbian_tokens(text: str) -> str:
+    """Convert Croatian text to Serbian vocabulary using word-token lookups."""
+    return croatian_to_serbian(text, TokenMatcher.name)
+
+
+class Translator(Engine):
+    """
+    Reusable Croatian to Serbian engine.
+    The matcher is built once from mapping (CROATIAN_TO_SERBIAN by default,
+    sharing the per-process matcher); see Engine for convert_bytes,
+    convert_file and convert_many.
+    """
+
+    def __init__(self, mapping: dict = None, matcher: str = None):
+        if mapping is None:
+            self.matcher = get_matcher(matcher)
+        else:
+            name = matcher or DEFAULT_MATCHER
+            if name not in MATCHERS:
+                raise ValueError(f"Unknown matcher '{name}' (choose from: {', '.join(MATCHERS)})")
+            self.matcher = MATCHERS[name](dict(mapping))
+        self.mapping = self.matcher.mapping
+        self.joined = joined_words(self.mapping)
+
+    def convert(self, text: str) -> str:
+        """Convert Croatian text to Serbian vocabulary."""
+        return self.matcher.sub(text)
+
+    def convert_counted(self, text: str, counts: dict = None) -> tuple:
+        """
+        Convert text and count the replacements in the same pass.
+        Returns (converted, replacements); see Matcher.subn for counts.
+        """
+        return self.matcher.subn(text, counts)
+
+
+def mapping_fingerprint() -> str:
+    """Hash of CROATIAN_TO_SERBIAN and the translator version."""
+    global _fingerprint
+    if _fingerprint is None:
+        _fingerprint = dictionary_fingerprint(CROATIAN_TO_SERBIAN)
+    return _fingerprint
+
+
+class TermHistogram:
+    """
+    Replacements per dictionary key over a run, merged from the per-file
+    counts that translate_path collects (in worker processes too).
+    Keys that never fired are kept with zero hits.
+    """
+
+    def __init__(self, matcher: str = None):
+        self.replacements = get_matcher(matcher).terms()
+        self.hits = dict.fromkeys(self.replacements, 0)
+        self.files = dict.fromkeys(self.replacements, 0)
+        self.total_files = 0
+
+    def add(self, counts: dict):
+        """Add the per-key counts of one file."""
+        self.total_files += 1
+        for key, n in counts.items():
+            self.hits[key] = self.hits.get(key, 0) + n
+            self.files[key] = self.files.get(key, 0) + 1
+
+    def rows(self) -> list:
+        """(key, replacement, hits, files) rows, most hits first."""
+        keys = sorted(self.hits, key=lambda key: (-self.hits[key], key))
+        return [(key, self.replacements.get(key, ''), self.hits[key], self.files[key]) for key in keys]
+
+    def used(self) -> int:
+        """Number of keys with at least one hit."""
+        return sum(1 for n in self.hits.values() if n)
+
+    def write(self, path: Path):
+        """Write the histogram as JSON if path ends in .json, else as CSV."""
+        path = Path(path)
+        rows = self.rows()
+        if path.suffix.lower() == '.json':
+            payload = {
+                'files': self.total_files,
+                'replacements': sum(self.hits.values()),
+                'terms': [dict(zip(('term', 'replacement', 'hits', 'files'), row)) for row in rows],
+            }
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(payload, f, ensure_ascii=False, indent=1)
+            return
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['term', 'replacement', 'hits', 'files'])
+            writer.writerows(rows)
+
+
+class TranslationCache:
+    """
+    Content-addressed cache of translated files.
+
+    Entries are keyed by the hash of the input bytes, the dictionary
+    fingerprint and the mode (SRT or plain text), so a changed dictionary
+    or mode never serves stale results. Each
+    entry is a '<key>.out' file (the exact output bytes) plus a '<key>.json'
+    sidecar. Hits refresh the entry's mtime; evict() removes the least
+    recently used entries until the cache fits in max_bytes. All writes go
+    through a rename, so several processes can share one cache directory.
+    """
+
+    def __init__(self, cache_dir: Path, max_bytes: int = DEFAULT_CACHE_MB * 1024 * 1024):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+
+    def key(self, data: bytes, is_srt: bool) -> str:
+        """Cache key for the given input bytes, translated as SRT or plain text."""
+        sha = hashlib.sha256(mapping_fingerprint().encode('ascii'))
+        sha.update(b'srt\n' if is_srt else b'text\n')
+        sha.update(data)
+        return sha.hexdigest()
+
+    def file_key(self, file_path: Path, is_srt: bool) -> str:
+        """Cache key for a file, hashed in chunks instead of read whole."""
+        sha = hashlib.sha256(mapping_fingerprint().encode('ascii'))
+        sha.update(b'srt\n' if is_srt else b'text\n')
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                sha.update(chunk)
+        return sha.hexdigest()
+
+    def get(self, key: str, output_path: Path) -> dict:
+        """
+        Copy a cached translation to output_path.
+        Returns the stored metadata, or None on a miss.
+        """
+        entry = self.cache_dir / f"{key}.out"
         try:
-            with open(file_path, 'r', encoding=encoding) as f:
-                f.read()
-            return encoding
-        except (UnicodeDecodeError, UnicodeError):
-            continue
-    
-    return 'utf-8'  # fallback
+            with open(self.cache_dir / f"{key}.json", 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(entry, output_path)
+            os.utime(entry)  # mark as recently used
+            return meta
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key: str, output_path: Path, meta: dict):
+        """Store the translated file at output_path with its metadata."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        suffix = f".tmp-{os.getpid()}"
+        entry = self.cache_dir / f"{key}.out"
+        sidecar = self.cache_dir / f"{key}.json"
+        shutil.copyfile(output_path, str(entry) + suffix)
+        with open(str(sidecar) + suffix, 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+        # Data first, so a visible sidecar always has its data file
+        os.replace(str(entry) + suffix, entry)
+        os.replace(str(sidecar) + suffix, sidecar)
+
+    def evict(self) -> int:
+        """
+        Remove least recently used entries until the cache fits in max_bytes.
+        Returns the number of entries removed.
+        """
+        entries = []
+        total = 0
+        try:
+            scan = list(os.scandir(self.cache_dir))
+        except OSError:
+            return 0
+        for item in scan:
+            if not item.name.endswith('.out'):
+                continue
+            try:
+                stat = item.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, item.path))
+            total += stat.st_size
 
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            for stale in (path[:-len('.out')] + '.json', path):
+                try:
+                    os.remove(stale)
+                except OSError:
+                    pass
+            total -= size
+            removed += 1
+        return removed
 
-def translate_file(input_path: Path, output_path: Path = None, in_place: bool = False) -> tuple:
+
+def final_output_path(input_path: Path, output_path: Path = None, in_place: bool = False) -> Path:
+    """Resolve where translate_path writes its result."""
+    if in_place:
+        return input_path
+    if output_path:
+        return output_path
+    # Add '_sr' suffix before extension
+    return input_path.parent / f"{input_path.stem}_sr{input_path.suffix}"
+
+
+def counting_converter(matcher: str = None, counts: dict = None):
     """
-    Translate Croatian words to Serbian in a file.
+    A text -> text function for convert_srt_text and stream_convert that
+    counts the replacements as it goes (see Matcher.subn).
+    Returns (convert, changes); changes[0] is the running total.
+    """
+    subn = get_matcher(matcher).subn
+    changes = [0]
+
+    def convert(text):
+        translated, n = subn(text, counts)
+        changes[0] += n
+        return translated
+
+    return convert, changes
+
+
+def translate_content(content: str, is_srt: bool, matcher: str = None, counts: dict = None) -> tuple:
+    """
+    Translate decoded file contents, only the dialogue of SRT files.
+    If counts is given, the replacements per dictionary key are added to it.
     
-    Args:
-        input_path: Path to input file
-        output_path: Path to output file (optional, defaults to adding '_sr' suffix)
-        in_place: If True, modify the file in place
+    Returns:
+        Tuple of (translated_content: str, changes_count: int)
+    """
+    if not is_srt:
+        return get_matcher(matcher).subn(content, counts)
+    convert, changes = counting_converter(matcher, counts)
+    return convert_srt_text(content, convert), changes[0]
+
+
+def joined_words(mapping: dict) -> frozenset:
+    """Lowercase words a multi-word key of mapping goes on after (see subtitle_io.find_cut)."""
+    return frozenset(word.lower() for key in mapping for word in key.split()[:-1])
+
+
+def stream_translate(input_path: Path, output_path: Path, matcher: str = None, srt: bool = True,
+                     stats: Stats = None, counts: dict = None) -> tuple:
+    """
+    Translate a file piece by piece with memory independent of its size.
+    If counts is given, the replacements per dictionary key are added to it.
+
+    Returns:
+        Tuple of (changes_count: int, encoding: str)
+    """
+    # Counted per file, since a restart with another encoding starts over
+    terms = {}
+    convert, changes = counting_converter(matcher, terms)
+
+    def reset():
+        changes[0] = 0
+        terms.clear()
+
+    encoding, _ = stream_convert(input_path, output_path, convert, srt, on_restart=reset, stats=stats,
+                                 joined=joined_words(get_matcher(matcher).mapping))
+    if counts is not None:
+        merge_counts(counts, terms)
+    return changes[0], encoding
+
+
+def merge_counts(counts: dict, other: dict):
+    """Add the per-key counts in other to counts."""
+    for key, n in other.items():
+        counts[key] = counts.get(key, 0) + n
+
+
+def translate_path(input_path: Path, output_path: Path = None, in_place: bool = False,
+                   matcher: str = None, cache: TranslationCache = None, stream: bool = False,
+                   stats: Stats = None, counts: dict = None) -> tuple:
+    """
+    Translate Croatian words to Serbian in a file without printing.
+    Safe to run in a worker process; arguments are the same as translate_file.
+    If counts is given, the replacements per dictionary key are added to it.
     
     Returns:
-        Tuple of (success: bool, changes_count: int)
+        Tuple of (success: bool, changes_count: int, encoding: str or None, error: str or None)
     """
+    stats = stats or NO_STATS
+    encoding = None
     try:
-        # Detect and read with appropriate encoding
-        encoding = detect_encoding(input_path)
-        print(f"  Detected encoding: {encoding}")
+        target_path = final_output_path(input_path, output_path, in_place)
+        is_srt = input_path.suffix.lower() == '.srt'
+        stream = stream or is_large_file(input_path)
         
-        with open(input_path, 'r', encoding=encoding, errors='replace') as f:
-            content = f.read()
+        data = None
+        if not stream:
+            with stats.time('read'):
+                with open(input_path, 'rb') as f:
+                    data = f.read()
         
-        # Count changes
-        original_content = content
+        cache_key = None
+        if cache:
+            with stats.time('cache'):
+                cache_key = cache.file_key(input_path, is_srt) if stream else cache.key(data, is_srt)
         
-        # Translate Croatian to Serbian
-        translated_content = croatian_to_serbian(content)
+        # Reuse an earlier translation of the same bytes with the same dictionary and mode
+        if cache:
+            with stats.time('cache'):
+                meta = cache.get(cache_key, target_path)
+            if meta is not None:
+                stats.count('cache_hits')
+                stats.count('bytes_in', os.path.getsize(input_path))
+                stats.count('bytes_out', os.path.getsize(target_path))
+                stats.count('replacements', meta['changes'])
+                if counts is not None:
+                    merge_counts(counts, meta['terms'])
+                return True, meta['changes'], meta['encoding'], None
+            stats.count('cache_misses')
         
-        # Count how many replacements were made
-        changes_count = sum(1 for a, b in zip(original_content.split(), translated_content.split()) if a != b)
+        # Ensure output directory exists
+        target_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Determine output path
-        if in_place:
-            final_output_path = input_path
-        elif output_path:
-            final_output_path = output_path
+        # Per-key counts of this file, kept with a cached translation
+        terms = {} if cache or counts is not None else None
+        if stream:
+            changes_count, encoding = stream_translate(input_path, target_path, matcher, is_srt, stats, terms)
         else:
-            # Add '_sr' suffix before extension
-            final_output_path = input_path.parent / f"{input_path.stem}_sr{input_path.suffix}"
-        
-        # Ensure output directory exists
-        final_output_path.parent.mkdir(parents=True, exist_ok=True)
+            stats.count('bytes_in', len(data))
+            
+            # Decode with the detected encoding
+            with stats.time('detect'):
+                content, encoding = decode_bytes(data)
+            
+            # Translate Croatian to Serbian, only the dialogue of SRT files
+            with stats.time('convert'):
+                translated_content, changes_count = translate_content(content, is_srt, matcher, terms)
+            
+            # Write with UTF-8 encoding
+            with stats.time('write'):
+                with open(target_path, 'w', encoding='utf-8-sig') as f:
+                    f.write(translated_content)
+            stats.count('bytes_out', os.path.getsize(target_path))
+        stats.count('replacements', changes_count)
+        if counts is not None:
+            merge_counts(counts, terms)
         
-        # Write with UTF-8 encoding
-        with open(final_output_path, 'w', encoding='utf-8-sig') as f:
-            f.write(translated_content)
+        if cache:
+            try:
+                with stats.time('cache'):
+                    cache.put(cache_key, target_path,
+                              {'changes': changes_count, 'terms': terms, 'encoding': encoding})
+            except OSError:
+                pass  # a read-only or full cache must not fail the translation
         
-        return True, changes_count
+        return True, changes_count, encoding, None
     
     except Exception as e:
-        print(f"  Error: {e}")
-        return False, 0
+        return False, 0, encoding, str(e)
+
+
+def translate_file(input_path: Path, output_path: Path = None, in_place: bool = False,
+                   matcher: str = None, cache: TranslationCache = None, stream: bool = False,
+                   stats: Stats = None, counts: dict = None) -> tuple:
+    """
+    Translate Croatian words to Serbian in a file.
+    
+    Args:
+        input_path: Path to input file
+        output_path: Path to output file (optional, defaults to adding '_sr' suffix)
+        in_place: If True, modify the file in place
+        matcher: Matcher backend name (see MATCHERS), defaults to DEFAULT_MATCHER
+        cache: Optional TranslationCache to reuse earlier results
+        stream: If True, translate in pieces instead of reading the whole file
+            (always done for files over LARGE_FILE_SIZE)
+        stats: Optional Stats to record timings and counters in
+        counts: Optional dict to add the replacements per dictionary key to
+    
+    Returns:
+        Tuple of (success: bool, changes_count: int)
+    """
+    success, changes_count, encoding, error = translate_path(input_path, output_path, in_place, matcher,
+                                                             cache, stream, stats, counts)
+    print_result(encoding, error)
+    return success, changes_count
+
+
+def init_worker(matcher: str = None):
+    """Build the matcher once per worker process instead of once per task."""
+    get_matcher(matcher)
+
+
+def translate_task(input_path: Path, output_path: Path = None, in_place: bool = False, matcher: str = None,
+                   cache: TranslationCache = None, stream: bool = False, instrument: bool = False,
+                   count_terms: bool = False) -> tuple:
+    """
+    Run translate_path for run_translations.
+    Returns its result plus the file's Stats (None unless instrument is set)
+    and its replacements per dictionary key (None unless count_terms is set).
+    """
+    stats = Stats(input_path) if instrument else None
+    counts = {} if count_terms else None
+    return translate_path(input_path, output_path, in_place, matcher, cache, stream, stats, counts) + (stats, counts)
+
+
+def run_translations(tasks: list, in_place: bool = False, matcher: str = None, jobs: int = 1,
+                     cache: TranslationCache = None, stream: bool = False, instrument: bool = False,
+                     count_terms: bool = False):
+    """
+    Translate (input_path, output_path) pairs, in a process pool if jobs > 1.
+    Yields translate_task results in the same order as tasks.
+    """
+    translate = partial(translate_task, in_place=in_place, matcher=matcher, cache=cache, stream=stream,
+                        instrument=instrument, count_terms=count_terms)
+    return pool_map(translate, [task[0] for task in tasks], [task[1] for task in tasks], jobs=jobs,
+                    initializer=init_worker, initargs=(matcher,))
+
+
+def read_input(task: tuple, stats: Stats, in_place: bool = False, cache: TranslationCache = None) -> tuple:
+    """
+    Pipeline read stage: the input bytes, or the cached result if there is one.
+    Returns (data, cache_key, meta); data is None on a cache hit.
+    """
+    input_path, output_path = task
+    with open(input_path, 'rb') as f:
+        data = f.read()
+    stats.count('bytes_in', len(data))
+    if not cache:
+        return data, None, None
+    
+    with stats.time('cache'):
+        cache_key = cache.key(data, input_path.suffix.lower() == '.srt')
+        meta = cache.get(cache_key, final_output_path(input_path, output_path, in_place))
+    stats.count('cache_hits' if meta is not None else 'cache_misses')
+    return (None if meta is not None else data), cache_key, meta
+
+
+def translate_data(value: tuple, matcher: str = None, instrument: bool = False) -> tuple:
+    """
+    Pipeline convert stage (in a worker): decode and translate input bytes.
+    Returns (translated_content, changes_count, terms, encoding, cache_key, meta, stats),
+    terms being the replacements per dictionary key; with instrument, stats
+    holds the worker's detect time for write_output to add to the file's
+    Stats, else it is None.
+    """
+    data, cache_key, meta = value
+    if meta is not None:
+        return None, meta['changes'], meta['terms'], meta['encoding'], cache_key, meta, None
+    stats = Stats() if instrument else NO_STATS
+    with stats.time('detect'):
+        content, encoding = decode_bytes(data)
+    # The pipeline only queues .srt files
+    terms = {}
+    translated_content, changes_count = translate_content(content, True, matcher, terms)
+    return translated_content, changes_count, terms, encoding, cache_key, None, stats if instrument else None
+
+
+def write_output(task: tuple, value: tuple, stats: Stats, in_place: bool = False,
+                 cache: TranslationCache = None) -> tuple:
+    """
+    Pipeline write stage.
+    Returns a translate_path style result plus the replacements per dictionary key.
+    """
+    translated_content, changes_count, terms, encoding, cache_key, meta, worker_stats = value
+    if worker_stats:
+        # Detection ran inside the convert stage, which was timed as a whole
+        detect = worker_stats.timings.get('detect', 0.0)
+        if detect:
+            stats.add_time('detect', detect)
+            stats.add_time('convert', -detect)
+    stats.count('replacements', changes_count)
+    target_path = final_output_path(task[0], task[1], in_place)
+    if meta is not None:
+        stats.count('bytes_out', os.path.getsize(target_path))
+        return True, changes_count, encoding, None, terms
+    
+    target_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(target_path, 'w', encoding='utf-8-sig') as f:
+        f.write(translated_content)
+    stats.count('bytes_out', os.path.getsize(target_path))
+    
+    if cache:
+        try:
+            with stats.time('cache'):
+                cache.put(cache_key, target_path,
+                          {'changes': changes_count, 'terms': terms, 'encoding': encoding})
+        except OSError:
+            pass  # a read-only or full cache must not fail the translation
+    return True, changes_count, encoding, None, terms
 
 
-def translate_text(text: str) -> str:
+def translate_text(text: str, matcher: str = None) -> str:
     """
     Translate Croatian words to Serbian in a text string.
     
     Args:
         text: Input text in Croatian
+        matcher: Matcher backend name (see MATCHERS), defaults to DEFAULT_MATCHER
     
     Returns:
         Text with Croatian words replaced by Serbian equivalents
     """
-    return croatian_to_serbian(text)
+    return croatian_to_serbian(text, matcher)
 
 
 def main():
@@ -1872,13 +1150,73 @@ def main():
         action='store_true',
         help='Process directories recursively'
     )
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        default=1,
+        help='Number of worker processes for directories (0 = one per CPU, default: 1)'
+    )
+    parser.add_argument(
+        '--stream',
+        action='store_true',
+        help='Translate files in pieces with bounded memory instead of reading them whole'
+    )
+    parser.add_argument(
+        '--pipeline',
+        action='store_true',
+        help='Overlap reading and writing files with translation in directories (asyncio pipeline)'
+    )
+    parser.add_argument(
+        '--cache-dir',
+        help='Directory for cached translations, reused while the input and dictionary are unchanged'
+    )
+    parser.add_argument(
+        '--cache-size',
+        type=int,
+        default=DEFAULT_CACHE_MB,
+        help=f'Size limit of the translation cache in MB (default: {DEFAULT_CACHE_MB})'
+    )
+    parser.add_argument(
+        '--matcher',
+        choices=sorted(MATCHERS),
+        default=DEFAULT_MATCHER,
+        help=f'Dictionary matcher backend (default: {DEFAULT_MATCHER})'
+    )
+    parser.add_argument(
+        '--stats',
+        action='store_true',
+        help='Print the time spent per stage and the counters at the end'
+    )
+    parser.add_argument(
+        '--stats-log',
+        metavar='FILE',
+        help='Write per-file timings and counters to FILE as JSON lines'
+    )
+    parser.add_argument(
+        '--term-stats',
+        metavar='FILE',
+        help='Write the replacements per dictionary entry over the run to FILE (.json, else CSV)'
+    )
+    parser.add_argument(
+        '--build-lexicon',
+        action='store_true',
+        help=f'Compile {LEXICON_PATH.name} into {LEXICON_ARTIFACT_PATH.name}, loaded at startup instead'
+    )
     
     args = parser.parse_args()
+    if args.pipeline and args.stream:
+        parser.error('--pipeline and --stream cannot be combined')
+    
+    if args.build_lexicon:
+        count = build_lexicon_artifact()
+        size = LEXICON_ARTIFACT_PATH.stat().st_size
+        print(f"Wrote {LEXICON_ARTIFACT_PATH} ({count} entries, {size / 1024:.1f} KB)")
+        return
     
     # If text argument provided, translate and print
     if args.text:
         print("Original:", args.text)
-        print("Translated:", translate_text(args.text))
+        print("Translated:", translate_text(args.text, args.matcher))
         return
     
     # If no input provided, show demo
@@ -1900,7 +1238,7 @@ def main():
         ]
         
         for sentence in demo_sentences:
-            translated = translate_text(sentence)
+            translated = translate_text(sentence, args.matcher)
             print(f"\n  HR: {sentence}")
             print(f"  SR: {translated}")
         
@@ -1912,6 +1250,16 @@ def main():
         return
     
     input_path = Path(args.input)
+    cache = TranslationCache(args.cache_dir, args.cache_size * 1024 * 1024) if args.cache_dir else None
+    
+    # Opt-in instrumentation: per-file timings and counters
+    instrument = args.stats or bool(args.stats_log)
+    histogram = TermHistogram(args.matcher) if args.term_stats else None
+    
+    def write_term_stats():
+        histogram.write(args.term_stats)
+        print(f"Term statistics: {histogram.used()}/{len(histogram.hits)} entries used, "
+              f"written to {args.term_stats}")
     
     if not input_path.exists():
         print(f"Error: '{input_path}' does not exist!")
@@ -1921,12 +1269,28 @@ def main():
     if input_path.is_file():
         print(f"Translating: {input_path.name}")
         output_path = Path(args.output) if args.output else None
-        success, changes = translate_file(input_path, output_path, args.in_place)
+        report = StatsReport('translate_croatian_to_serbian', args.stats_log) if instrument else None
+        stats = Stats(input_path) if instrument else None
+        counts = {} if histogram else None
+        success, changes = translate_file(input_path, output_path, args.in_place, args.matcher, cache,
+                                          args.stream, stats, counts)
         
         if success:
             print(f"  ✓ Translation complete ({changes} words changed)")
         else:
             print(f"  ✗ Translation failed")
+        if cache:
+            cache.evict()
+        if histogram:
+            if success:
+                histogram.add(counts)
+            write_term_stats()
+        if report:
+            stats.status = 'failed' if not success else 'cached' if stats.counters.get('cache_hits') else 'translated'
+            report.add(stats)
+            report.close()
+            if args.stats:
+                report.print_summary()
         return
     
     # Process directory
@@ -1943,27 +1307,70 @@ def main():
         print(f"Found {len(files)} SRT file(s) to translate")
         print("-" * 50)
         
-        success_count = 0
-        for srt_file in files:
+        def plan_tasks():
+            for srt_file in files:
+                if args.output:
+                    output_dir = Path(args.output)
+                    relative_path = srt_file.relative_to(input_path)
+                    output_path = output_dir / relative_path
+                else:
+                    output_path = None
+                yield srt_file, output_path
+        
+        def report_task(task, result):
+            nonlocal success_count
+            srt_file, _ = task
+            success, changes, encoding, error, stats, terms = result
             print(f"\nProcessing: {srt_file.name}")
-            
-            if args.output:
-                output_dir = Path(args.output)
-                relative_path = srt_file.relative_to(input_path)
-                output_path = output_dir / relative_path
-            else:
-                output_path = None
-            
-            success, changes = translate_file(srt_file, output_path, args.in_place)
+            print_result(encoding, error)
             
             if success:
                 print(f"  ✓ Complete ({changes} words changed)")
                 success_count += 1
+                if histogram:
+                    histogram.add(terms)
             else:
                 print(f"  ✗ Failed")
+            
+            if report:
+                stats.status = 'failed' if not success else 'cached' if stats.counters.get('cache_hits') else 'translated'
+                report.add(stats)
+        
+        jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+        report = StatsReport('translate_croatian_to_serbian', args.stats_log) if instrument else None
+        success_count = 0
+        if args.pipeline:
+            # Read, translate (in --jobs processes) and write concurrently
+            def report_pipeline(task, result, error, stats):
+                if error is not None:
+                    result = (False, 0, None, str(error), None)
+                report_task(task, result[:4] + (stats if report else None, result[4]))
+            
+            run_pipeline(plan_tasks(),
+                         partial(read_input, in_place=args.in_place, cache=cache),
+                         partial(translate_data, matcher=args.matcher, instrument=instrument),
+                         partial(write_output, in_place=args.in_place, cache=cache),
+                         report_pipeline, jobs=jobs, instrument=instrument,
+                         initializer=init_worker, initargs=(args.matcher,))
+        else:
+            # Translate (in parallel with --jobs) and report in the original order
+            tasks = list(plan_tasks())
+            results = run_translations(tasks, args.in_place, args.matcher, jobs, cache, args.stream, instrument,
+                                       bool(histogram))
+            for task, result in zip(tasks, results):
+                report_task(task, result)
+        
+        if cache:
+            cache.evict()
         
         print("\n" + "=" * 50)
         print(f"Translation complete: {success_count}/{len(files)} files processed")
+        if histogram:
+            write_term_stats()
+        if report:
+            report.close()
+            if args.stats:
+                report.print_summary()
 
 
 if __name__ == '__main__':